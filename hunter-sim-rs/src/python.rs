@@ -4,7 +4,9 @@ use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyAny};
 use crate::config::{BuildConfig, HunterType, Meta};
 use crate::simulation::run_and_aggregate;
+use crate::stats::AggregatedStats;
 use crate::build_generator::{BuildGenerator, AttributeInfo, TalentInfo};
+use rayon::prelude::*;
 use std::collections::HashMap;
 
 /// Helper to convert PyDict to HashMap<String, i32>
@@ -270,11 +272,18 @@ fn simulate_batch(py: Python<'_>, config_jsons: Vec<String>, num_sims: usize, pa
         PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid config JSON: {}", e))
     )?;
     
-    // Release GIL and run all simulations in parallel
+    // Release GIL and run all simulations. In parallel mode the builds run concurrently
+    // as well as their sims, so batches with few sims per build still use every core.
     let results = py.allow_threads(|| {
-        configs.iter()
-            .map(|config| run_and_aggregate(config, num_sims, parallel))
-            .collect::<Vec<_>>()
+        if parallel {
+            configs.par_iter()
+                .map(|config| run_and_aggregate(config, num_sims, true))
+                .collect::<Vec<_>>()
+        } else {
+            configs.iter()
+                .map(|config| run_and_aggregate(config, num_sims, false))
+                .collect::<Vec<_>>()
+        }
     });
     
     // Serialize results (inside GIL)
@@ -289,6 +298,108 @@ fn simulate_batch(py: Python<'_>, config_jsons: Vec<String>, num_sims: usize, pa
     Ok(json_results)
 }
 
+/// A base build parsed once for a whole optimization run.
+/// Each simulated build then only sends its talents and attributes, instead of
+/// re-serializing and re-parsing the full config (stats, relics, gems, ...) per build.
+#[pyclass]
+struct SimSession {
+    base: BuildConfig,
+}
+
+#[pymethods]
+impl SimSession {
+    #[new]
+    fn new(config_json: &str) -> PyResult<Self> {
+        let base: BuildConfig = serde_json::from_str(config_json)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Invalid config JSON: {}", e)))?;
+        Ok(SimSession { base })
+    }
+    
+    /// Simulate (talents, attributes) builds on the base config, returning one stats JSON per build
+    #[pyo3(signature = (builds, num_sims, parallel=false))]
+    fn simulate_batch(
+        &self,
+        py: Python<'_>,
+        builds: Vec<(HashMap<String, i32>, HashMap<String, i32>)>,
+        num_sims: usize,
+        parallel: bool,
+    ) -> PyResult<Vec<String>> {
+        // Release GIL and run every build
+        let results = py.allow_threads(move || self.run_builds(builds, num_sims, parallel));
+        
+        // Serialize results (inside GIL)
+        let json_results: Result<Vec<String>, _> = results.iter()
+            .map(|stats| serde_json::to_string(stats))
+            .collect();
+        
+        json_results.map_err(|e| 
+            PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Failed to serialize results: {}", e))
+        )
+    }
+    
+    /// Like simulate_batch, but returns every build's stats as one JSON array.
+    /// Serialization happens with the GIL released, and Python parses the whole
+    /// batch with a single json.loads instead of one per build.
+    #[pyo3(signature = (builds, num_sims, parallel=false))]
+    fn simulate_batch_json(
+        &self,
+        py: Python<'_>,
+        builds: Vec<(HashMap<String, i32>, HashMap<String, i32>)>,
+        num_sims: usize,
+        parallel: bool,
+    ) -> PyResult<String> {
+        py.allow_threads(move || serde_json::to_string(&self.run_builds(builds, num_sims, parallel)))
+            .map_err(|e| 
+                PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Failed to serialize results: {}", e))
+            )
+    }
+}
+
+impl SimSession {
+    /// Run every build on the base config, swapping only the talents and attributes.
+    /// In parallel mode builds run concurrently as well as their sims.
+    fn run_builds(
+        &self,
+        builds: Vec<(HashMap<String, i32>, HashMap<String, i32>)>,
+        num_sims: usize,
+        parallel: bool,
+    ) -> Vec<AggregatedStats> {
+        if parallel {
+            builds.into_par_iter()
+                .map(|(talents, attributes)| run_and_aggregate(&self.with_build(talents, attributes), num_sims, true))
+                .collect()
+        } else {
+            let mut config = self.with_build(HashMap::new(), HashMap::new());
+            builds.into_iter()
+                .map(|(talents, attributes)| {
+                    config.talents = talents;
+                    config.attributes = attributes;
+                    run_and_aggregate(&config, num_sims, false)
+                })
+                .collect()
+        }
+    }
+    
+    /// The base config with these talents and attributes; the base's own maps are not cloned
+    fn with_build(&self, talents: HashMap<String, i32>, attributes: HashMap<String, i32>) -> BuildConfig {
+        let base = &self.base;
+        BuildConfig {
+            meta: base.meta.clone(),
+            hunter: base.hunter,
+            level: base.level,
+            stats: base.stats.clone(),
+            talents,
+            attributes,
+            inscryptions: base.inscryptions.clone(),
+            mods: base.mods.clone(),
+            relics: base.relics.clone(),
+            gems: base.gems.clone(),
+            gadgets: base.gadgets.clone(),
+            bonuses: base.bonuses.clone(),
+        }
+    }
+}
+
 /// Python-callable build generation function - generate multiple valid builds at once
 #[pyfunction]
 #[pyo3(signature = (level, talents, attributes, attribute_dependencies, attribute_point_gates, attribute_exclusions, count))]
@@ -383,5 +494,6 @@ fn rust_sim(_py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(get_available_cores, m)?)?;
     m.add_function(wrap_pyfunction!(get_hunter_stats, m)?)?;
     m.add_function(wrap_pyfunction!(generate_builds, m)?)?;
+    m.add_class::<SimSession>()?;
     Ok(())
 }
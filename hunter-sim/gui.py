@@ -17,12 +17,17 @@ import time
 from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass, field
 from concurrent.futures import ProcessPoolExecutor
-import statistics
-from collections import Counter
-import copy
+import math
+from collections import Counter, OrderedDict
+from operator import attrgetter, itemgetter
+import heapq
 import sys
 import os
 import json
+import hashlib
+import pickle
+import functools
+from array import array
 from tkinter import filedialog
 
 # Add parent directory to path for imports
@@ -30,7 +35,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from hunters import Borge, Knox, Ozzy, Hunter
-from sim import SimulationManager, Simulation, sim_worker
+from sim import SimulationManager, Simulation
 
 # Try to import Rust simulator
 try:
@@ -39,8 +44,54 @@ try:
 except ImportError:
     RUST_AVAILABLE = False
 
+# Aggregated build results persisted across optimizer runs, keyed on a fingerprint
+# of the engine that produced them so results from older sim code are never reused
+SIM_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".sim_cache")
+# Python sources whose contents decide a Python-engine result
+PYTHON_SIM_SOURCES = ("sim.py", "hunters.py", "units.py")
+# Most result files kept on disk; the least recently used are evicted past this
+SIM_CACHE_MAX_FILES = 20_000
+# Cache writes between eviction passes over the cache directory
+SIM_CACHE_PRUNE_EVERY = 500
+# Most recent results kept in memory, so repeat configs skip both the sim and the disk
+SIM_MEMO_SIZE = 50_000
+# Builds per Rust simulate_batch call in the optimizer loops; bounds how stale progress and stop checks get
+RUST_BATCH_SIZE = 256
+# Seconds between progress updates queued by the optimizer loops; the UI polls every 100 ms
+PROGRESS_POST_INTERVAL = 0.1
+# Most queued messages one UI poll handles, so a backlog cannot stall the Tk event loop
+POLL_MAX_MESSAGES = 500
+# Fitness input for a build that failed to simulate; shared by every failure, never modified
+FAILED_BUILD_RESULT = {'died_early': True}
+# Per-sim fields _aggregate_results reads. Sims are packed to these, flat in one array('d'),
+# so pool workers send a build back as a single buffer instead of a full result dict per sim
+SIM_RESULT_FIELDS = ("final_stage", "elapsed_time", "damage", "kills", "damage_taken", "total_loot")
+_sim_result_fields = itemgetter(*SIM_RESULT_FIELDS)
+# Most builds per task when the sampling run streams builds through its pool
+SAMPLING_POOL_CHUNK = 16
+# Every ranking the results tabs, advisor and export read, as (BuildResult attribute, highest first)
+RESULT_RANKINGS = (
+    ("avg_final_stage", True),
+    ("avg_loot_per_hour", True),
+    ("avg_elapsed_time", False),
+    ("avg_damage", True),
+    ("survival_rate", True),
+)
+# Builds kept per ranking when pruning; the "all" tab shows the top 20 by stage
+RESULTS_KEEP_PER_RANKING = 20
+# Valid builds held before pruning to the ones a ranking could still show
+RESULTS_PRUNE_THRESHOLD = 5000
 
-@dataclass
+# Upgrade advisor resource categories (same for all hunters), and each stat's category
+RESOURCE_CATEGORIES = {
+    "Common Resource": ("hp", "power", "regeneration"),
+    "Rare Resource": ("dr", "evade", "effect"),
+    "Very Rare Resource": ("special_chance", "crit_chance", "special_damage", "crit_damage", "speed"),
+}
+STAT_TO_CATEGORY = {stat: category for category, stats in RESOURCE_CATEGORIES.items() for stat in stats}
+
+
+@dataclass(slots=True)
 class BuildResult:
     """Stores the results of a simulated build."""
     talents: Dict[str, int]
@@ -72,6 +123,31 @@ class BuildResult:
         return self.avg_final_stage < other.avg_final_stage
 
 
+@dataclass(frozen=True, slots=True)
+class RunSettings:
+    """Optimizer settings, read from the Tk variables on the UI thread when a run starts."""
+    hunter_name: str
+    level: int
+    num_sims: int
+    num_procs: int
+    use_rust: bool  # Rust requested and available
+    use_evolutionary: bool
+    use_progressive: bool
+    population_size: int
+    max_builds: int
+
+
+@dataclass(frozen=True, slots=True)
+class AdvisorSettings:
+    """Upgrade advisor settings, read from the Tk variables on the UI thread when it starts."""
+    hunter_name: str
+    num_sims: int
+    num_procs: int
+    use_rust: bool  # Rust requested and available
+    use_best_build: bool
+    stat_keys: Tuple[str, ...]  # Stats to try +1 of, in input form order
+
+
 class BuildGenerator:
     """Generates all valid talent/attribute combinations for a given hunter and level."""
     
@@ -83,6 +159,18 @@ class BuildGenerator:
         self.costs = hunter_class.costs
         self.use_smart_sampling = use_smart_sampling
         
+        # Attribute unlock rules, looked up once instead of per walk step
+        self._deps = getattr(hunter_class, 'attribute_dependencies', {})
+        # Points that must be spent in OTHER attributes before an attribute unlocks
+        self._point_gates = getattr(hunter_class, 'attribute_point_gates', {})
+        # Mutually exclusive pairs as attr -> partners, so checks don't scan every pair
+        self._excl_map: Dict[str, Tuple[str, ...]] = {}
+        for excl_pair in getattr(hunter_class, 'attribute_exclusions', []):
+            for attr in excl_pair:
+                other = excl_pair[0] if excl_pair[1] == attr else excl_pair[1]
+                self._excl_map[attr] = self._excl_map.get(attr, ()) + (other,)
+        self._walk_tables: Tuple = None  # Built on first use by _get_walk_tables
+        
         # Calculate dynamic maxes for infinite attributes based on total points
         self._calculate_dynamic_attr_maxes()
         
@@ -126,51 +214,61 @@ class BuildGenerator:
             return 250
         return int(base_max)
         
-    def get_talent_combinations(self) -> List[Dict[str, int]]:
-        """Generate all valid talent point allocations."""
+    def get_talent_combinations(self, as_dicts: bool = True) -> List:
+        """Generate all valid talent point allocations.
+        
+        With as_dicts=False, returns compact level tuples in self.costs["talents"] order,
+        leaving dict materialization to the caller (e.g. only for the builds it samples).
+        """
         talents = list(self.costs["talents"].keys())
-        max_levels = [min(self.costs["talents"][t]["max"], self.talent_points) 
+        max_levels = [int(min(self.costs["talents"][t]["max"], self.talent_points)) 
                       for t in talents]
         
+        # Group partial allocations by points spent, so each talent extends a whole
+        # group with one list comprehension instead of recursing once per prefix
+        by_spent = {0: [()]}
+        for max_lvl in max_levels[:-1]:
+            next_by_spent = {}
+            for spent, prefixes in by_spent.items():
+                for lvl in range(min(max_lvl, self.talent_points - spent) + 1):
+                    suffix = (lvl,)
+                    next_by_spent.setdefault(spent + lvl, []).extend([p + suffix for p in prefixes])
+            by_spent = next_by_spent
+        
         combinations = []
-        self._generate_talent_combos(talents, max_levels, {}, 0, 0, combinations)
+        for spent, prefixes in by_spent.items():
+            for lvl in range(min(max_levels[-1], self.talent_points - spent) + 1):
+                suffix = (lvl,)
+                combinations.extend([p + suffix for p in prefixes])
+        if as_dicts:
+            return [dict(zip(talents, levels)) for levels in combinations]
         return combinations
     
-    def _generate_talent_combos(self, talents, max_levels, current, index, points_spent, results):
-        """Recursively generate talent combinations."""
-        if index == len(talents):
-            if points_spent <= self.talent_points:
-                results.append(current.copy())
-            return
-        
-        talent = talents[index]
-        max_lvl = min(max_levels[index], self.talent_points - points_spent)
+    def get_attribute_combinations(self, max_per_infinite: int = 30, as_dicts: bool = True) -> List:
+        """Generate valid attribute point allocations using a smarter approach.
         
-        for lvl in range(0, int(max_lvl) + 1):
-            current[talent] = lvl
-            self._generate_talent_combos(talents, max_levels, current, index + 1, 
-                                        points_spent + lvl, results)
-    
-    def get_attribute_combinations(self, max_per_infinite: int = 30) -> List[Dict[str, int]]:
-        """Generate valid attribute point allocations using a smarter approach."""
+        With as_dicts=False, returns level tuples in self.costs["attributes"] order.
+        """
         attributes = list(self.costs["attributes"].keys())
         attr_costs = {a: self.costs["attributes"][a]["cost"] for a in attributes}
         attr_max = {a: self.costs["attributes"][a]["max"] for a in attributes}
         
         combinations = []
-        self._generate_attr_combos(attributes, attr_costs, attr_max, {}, 0, 0, combinations, max_per_infinite)
+        self._generate_attr_combos(attributes, attr_costs, attr_max, [0] * len(attributes), 0, 0,
+                                   combinations, max_per_infinite)
+        if as_dicts:
+            return [dict(zip(attributes, levels)) for levels in combinations]
         return combinations
     
     def _generate_attr_combos(self, attributes, costs, max_levels, current, index, points_spent, results, max_per_infinite):
-        """Recursively generate attribute combinations."""
+        """Recursively generate attribute combinations as level tuples.
+        
+        Levels are capped by the points left, so no branch can go over budget.
+        """
         if index == len(attributes):
-            if points_spent <= self.attribute_points:
-                results.append(current.copy())
+            results.append(tuple(current))
             return
         
-        if points_spent > self.attribute_points:
-            return
-            
         attr = attributes[index]
         cost = costs[attr]
         max_lvl = min(max_levels[attr], (self.attribute_points - points_spent) // cost)
@@ -182,8 +280,14 @@ class BuildGenerator:
         # Cap infinite attributes for performance
         max_lvl = int(min(max_lvl, max_per_infinite))
         
+        if index == len(attributes) - 1:
+            for lvl in range(0, max_lvl + 1):
+                current[index] = lvl
+                results.append(tuple(current))
+            return
+        
         for lvl in range(0, max_lvl + 1):
-            current[attr] = lvl
+            current[index] = lvl
             self._generate_attr_combos(attributes, costs, max_levels, current, index + 1,
                                        points_spent + (lvl * cost), results, max_per_infinite)
     
@@ -199,20 +303,40 @@ class BuildGenerator:
         import random
         
         builds = []
-        talents_list = list(self.costs["talents"].keys())
-        attrs_list = list(self.costs["attributes"].keys())
-        attr_costs = {a: self.costs["attributes"][a]["cost"] for a in attrs_list}
-        attr_max = {a: self.costs["attributes"][a]["max"] for a in attrs_list}
-        talent_max = {t: self.costs["talents"][t]["max"] for t in talents_list}
+        talents_list, attrs_list, attr_costs, attr_max, talent_max, attr_rules, _ = self._get_walk_tables()
         
         # ALL builds use random walk - simulates human clicking point-by-point
         for _ in range(sample_size):
             talents = self._random_walk_talent_allocation(talents_list, talent_max)
-            attrs = self._random_walk_attr_allocation(attrs_list, attr_costs, attr_max)
+            attrs = self._random_walk_attr_allocation(attrs_list, attr_costs, attr_max, attr_rules)
             builds.append((talents, attrs))
         
         return builds
     
+    def _get_walk_tables(self) -> Tuple:
+        """Name lists, cost/max tables and attribute walk rules used by the random walks.
+        
+        They only depend on the hunter's cost table, so they are built once per generator
+        and shared by callers that ask for one build at a time (progressive evolution).
+        The last entry indexes talents and attributes by position for the elite walk:
+        (talent caps, None if unlimited; known talent indices; unknown_talent's index or
+        None; unlimited attribute indices).
+        """
+        if self._walk_tables is None:
+            talents_list = list(self.costs["talents"].keys())
+            attrs_list = list(self.costs["attributes"].keys())
+            attr_costs = {a: self.costs["attributes"][a]["cost"] for a in attrs_list}
+            attr_max = {a: self.costs["attributes"][a]["max"] for a in attrs_list}
+            talent_max = {t: self.costs["talents"][t]["max"] for t in talents_list}
+            attr_rules = self._attr_walk_rules(attrs_list, attr_costs, attr_max)
+            talent_caps = [None if talent_max[t] == float('inf') else int(talent_max[t]) for t in talents_list]
+            known_talents = [i for i, t in enumerate(talents_list) if t != 'unknown_talent']
+            unknown_talent = talents_list.index('unknown_talent') if 'unknown_talent' in talents_list else None
+            unlimited_attrs = [i for i, a in enumerate(attrs_list) if attr_max[a] == float('inf')]
+            walk_index = (talent_caps, known_talents, unknown_talent, unlimited_attrs)
+            self._walk_tables = (talents_list, attrs_list, attr_costs, attr_max, talent_max, attr_rules, walk_index)
+        return self._walk_tables
+    
     def _generate_single_build(self, strategy: str, talents_list, attrs_list, 
                                attr_costs, attr_max, talent_max) -> Tuple[Dict, Dict]:
         """Generate a single build using true random walk for both talents and attributes.
@@ -239,54 +363,91 @@ class BuildGenerator:
         This explores the full space a human would without algorithmic bias.
         """
         import random
+        rand = random.random  # int(rand() * k) is a cheaper uniform pick than random.choice
         result = {t: 0 for t in talents}
         remaining = self.talent_points
+        caps = {t: None if max_levels[t] == float('inf') else int(max_levels[t]) for t in talents}
+        
+        # KNOWN talents that can still accept points (exclude unknown_talent), found once and
+        # dropped in place as they max out, so the pick order matches a per-step rebuild
+        valid_talents = [t for t in talents if t != 'unknown_talent' and (caps[t] is None or caps[t] > 0)]
         
         # Point-by-point random allocation
         while remaining > 0:
-            # Find all KNOWN talents that can still accept points (exclude unknown_talent)
-            valid_talents = [
-                t for t in talents 
-                if t != 'unknown_talent' and (max_levels[t] == float('inf') or result[t] < int(max_levels[t]))
-            ]
-            
             # Only use unknown_talent as LAST RESORT when all known talents are maxed
             if not valid_talents:
                 if 'unknown_talent' in talents:
-                    valid_talents = ['unknown_talent']
-                else:
-                    break  # All talents maxed
+                    result['unknown_talent'] += remaining
+                break  # Otherwise all talents maxed
             
             # Pick random talent and add 1 point
-            chosen = random.choice(valid_talents)
+            chosen = valid_talents[int(rand() * len(valid_talents))]
             result[chosen] += 1
             remaining -= 1
+            if caps[chosen] is not None and result[chosen] >= caps[chosen]:
+                valid_talents.remove(chosen)
         
         return result
     
-    def _can_unlock_attribute(self, attr: str, current_allocation: Dict[str, int], costs: Dict[str, int]) -> bool:
-        """Check if an attribute can be unlocked based on point gates.
-        
-        Point gates require a certain number of points to be spent in OTHER attributes
-        before this attribute can be unlocked.
-        """
-        point_gates = getattr(self.hunter_class, 'attribute_point_gates', {})
-        
-        if attr not in point_gates:
-            return True  # No gate requirement
+    def _attr_walk_rules(self, attrs, costs, max_levels) -> Tuple:
+        """Flatten the attribute rules into per-index lists for _random_walk_attr_allocation.
         
-        required_points = point_gates[attr]
+        The per-point loop then only does list indexing instead of dict lookups and
+        float('inf') checks. The rules are the same for every build, so callers generating
+        a batch build them once and pass them to each walk.
         
-        # Calculate total points spent in OTHER attributes (excluding this one)
-        points_spent = sum(
-            current_allocation.get(other_attr, 0) * costs[other_attr]
-            for other_attr in current_allocation
-            if other_attr != attr
-        )
-        
-        return points_spent >= required_points
+        Each attribute's cap, dependency and exclusion check is compiled into its own
+        function with that attribute's indexes and limits inlined as constants, so only
+        the rules it actually has are evaluated.
+        """
+        deps = self._deps
+        point_gates = self._point_gates
+        
+        index = {a: i for i, a in enumerate(attrs)}
+        n = len(attrs)
+        attr_costs = [costs[a] for a in attrs]
+        attr_caps = [None if max_levels[a] == float('inf') else int(max_levels[a]) for a in attrs]
+        attr_gates = [point_gates.get(a) for a in attrs]
+        attr_reqs = []
+        attr_partners = []
+        for attr in attrs:
+            # A requirement on an attribute we don't allocate can never be met
+            attr_reqs.append(tuple((index.get(req_attr), req_level)
+                                   for req_attr, req_level in deps.get(attr, {}).items()))
+            attr_partners.append(tuple(index.get(other) for other in self._excl_map.get(attr, ())))
+        
+        # Attributes whose cap/dependency/exclusion checks may change when a given attribute gains a point
+        affected = [{i} for i in range(n)]
+        for i in range(n):
+            for req, _ in attr_reqs[i]:
+                if req is not None:
+                    affected[req].add(i)
+            for other in attr_partners[i]:
+                if other is not None:
+                    affected[other].add(i)
+        
+        unlock_checks = []
+        for i in range(n):
+            terms = []
+            if attr_caps[i] is not None:
+                terms.append(f"result[{i}] < {attr_caps[i]}")
+            for req, req_level in attr_reqs[i]:
+                if req is not None:
+                    terms.append(f"result[{req}] >= {req_level}")
+                elif req_level > 0:
+                    terms.append("False")
+            terms.extend(f"not result[{other}]" for other in attr_partners[i] if other is not None)
+            # Only ints built above go into the source
+            unlock_checks.append(eval(f"lambda result: {' and '.join(terms) or 'True'}"))
+        
+        initial = [0] * n
+        initial_unlocked = sum(1 << i for i in range(n) if unlock_checks[i](initial))
+        
+        by_cost = sorted(range(n), key=attr_costs.__getitem__, reverse=True)
+        gated = [i for i in range(n) if attr_gates[i] is not None]
+        return attr_costs, attr_gates, unlock_checks, initial_unlocked, affected, by_cost, gated
     
-    def _random_walk_attr_allocation(self, attrs, costs, max_levels) -> Dict[str, int]:
+    def _random_walk_attr_allocation(self, attrs, costs, max_levels, rules: Tuple = None) -> Dict[str, int]:
         """True random walk attribute allocation - simulate human point-by-point clicking.
         
         Point-by-point random allocation without algorithmic bias:
@@ -297,14 +458,25 @@ class BuildGenerator:
            - Add 1 point to it
         
         This explores the full space a human would access through random clicking.
+        `rules` is the output of _attr_walk_rules, built here when not passed in.
         """
         import random
-        result = {a: 0 for a in attrs}
+        rand = random.random  # int(rand() * k) is a cheaper uniform pick than random.choice
         remaining = self.attribute_points
         
-        # Get dependencies if they exist
-        deps = getattr(self.hunter_class, 'attribute_dependencies', {})
-        exclusions = getattr(self.hunter_class, 'attribute_exclusions', [])
+        if rules is None:
+            rules = self._attr_walk_rules(attrs, costs, max_levels)
+        attr_costs, attr_gates, unlock_checks, unlocked_mask, affected, by_cost, gated = rules
+        n = len(attrs)
+        result = [0] * n
+        
+        # Validity is kept as bitmasks and only the bits a point can flip are re-checked.
+        # Cap/dependency/exclusion checks only change when a related level does. Spending
+        # only lowers `remaining` and only raises points spent elsewhere, so once an
+        # attribute is unaffordable it stays so, and once a point gate opens it stays open.
+        affordable_mask = (1 << n) - 1
+        next_unaffordable = 0
+        closed_gates = gated
         
         # Pure point-by-point random allocation:
         max_iterations = 10000  # Safety limit
@@ -312,60 +484,49 @@ class BuildGenerator:
         stuck_count = 0  # Track how many times we found no valid moves
         while remaining > 0 and iteration < max_iterations:
             iteration += 1
+            # Check cost
+            while next_unaffordable < n and attr_costs[by_cost[next_unaffordable]] > remaining:
+                affordable_mask &= ~(1 << by_cost[next_unaffordable])
+                next_unaffordable += 1
+            # Check point gates (points spent in OTHER attributes, from the running total)
+            gate_mask = 0
+            if closed_gates:
+                total_spent = self.attribute_points - remaining
+                closed_gates = [i for i in closed_gates
+                                if total_spent - result[i] * attr_costs[i] < attr_gates[i]]
+                for i in closed_gates:
+                    gate_mask |= 1 << i
+            
             # Find all currently valid attributes (can add at least 1 more point)
-            valid_attrs = []
-            for attr in attrs:
-                # Check cost
-                cost = costs[attr]
-                if cost > remaining:
-                    continue
-                # Check if at max level
-                if max_levels[attr] == float('inf'):
-                    # Unlimited attributes can ALWAYS accept more points (if we can afford it)
-                    pass  # No max check needed
-                else:
-                    max_lvl = int(max_levels[attr])
-                    if result[attr] >= max_lvl:
-                        continue
-                # Check dependencies
-                if attr in deps:
-                    can_use = all(result.get(req_attr, 0) >= req_level 
-                                 for req_attr, req_level in deps[attr].items())
-                    if not can_use:
-                        continue
-                # Check point gates
-                if not self._can_unlock_attribute(attr, result, costs):
-                    continue
-                # Check exclusions
-                excluded = False
-                for excl_pair in exclusions:
-                    if attr in excl_pair:
-                        other = excl_pair[0] if excl_pair[1] == attr else excl_pair[1]
-                        if result.get(other, 0) > 0:
-                            excluded = True
-                            break
-                if excluded:
-                    continue
-                valid_attrs.append(attr)
+            valid_mask = unlocked_mask & affordable_mask & ~gate_mask
+            num_valid = valid_mask.bit_count()
             
-            if not valid_attrs:
+            if not num_valid:
                 stuck_count += 1
                 if stuck_count >= 3:  # Give up after 3 consecutive failures
                     # Can't find valid moves - just allocate remaining points randomly to unlimited attrs
-                    unlimited_attrs = [a for a in attrs if costs[a] <= remaining]
+                    unlimited_attrs = [i for i in range(n) if attr_costs[i] <= remaining]
                     while remaining > 0 and unlimited_attrs:
-                        chosen = random.choice(unlimited_attrs)
+                        chosen = unlimited_attrs[int(rand() * len(unlimited_attrs))]
                         result[chosen] += 1
-                        remaining -= costs[chosen]
+                        remaining -= attr_costs[chosen]
                     break  # Done allocating
             else:
                 stuck_count = 0  # Reset counter when we find valid moves
-            
-            # Pick random valid attribute and add 1 point
-            if valid_attrs:  # Safety check
-                chosen = random.choice(valid_attrs)
+                
+                # Pick random valid attribute (the k-th set bit) and add 1 point
+                for _ in range(int(rand() * num_valid)):
+                    valid_mask &= valid_mask - 1
+                chosen = (valid_mask & -valid_mask).bit_length() - 1
                 result[chosen] += 1
-                remaining -= costs[chosen]
+                remaining -= attr_costs[chosen]
+                for i in affected[chosen]:
+                    if unlock_checks[i](result):
+                        unlocked_mask |= 1 << i
+                    else:
+                        unlocked_mask &= ~(1 << i)
+        
+        result = dict(zip(attrs, result))
         
         # CRITICAL: Validate total points spent doesn't exceed budget
         total_spent = sum(result[attr] * costs[attr] for attr in result)
@@ -376,6 +537,158 @@ class BuildGenerator:
         return result
 
 
+def _mean(values: List) -> float:
+    """Arithmetic mean of a sim batch; math.fsum is ~30x cheaper than statistics.mean's exact Fraction sum."""
+    return math.fsum(values) / len(values)
+
+
+def _clone_config(config: Dict) -> Dict:
+    """Copy a build config one level deep, enough to edit any single section in place."""
+    return {k: (v.copy() if isinstance(v, dict) else v) for k, v in config.items()}
+
+
+def _pack_sim_results(results) -> array:
+    """Pack sim result dicts into one flat array('d'), SIM_RESULT_FIELDS per sim."""
+    return array('d', itertools.chain.from_iterable(map(_sim_result_fields, results)))
+
+
+def _simulate_config_worker(hunter_class, config: Dict, num_sims: int):
+    """Process pool entry point: run every sim for one complete build config.
+    
+    Returns the sims packed by _pack_sim_results, or None if the build failed to simulate.
+    """
+    try:
+        return _pack_sim_results(Simulation(hunter_class(config)).run() for _ in range(num_sims))
+    except Exception:
+        return None
+
+
+# Per-process run settings for _simulate_build_worker, set once by _init_build_worker
+_worker_hunter_class = None
+_worker_base_config: Dict = {}
+_worker_num_sims = 0
+
+
+def _init_build_worker(hunter_class, base_config: Dict, num_sims: int):
+    """Process pool initializer: keep the run's settings in the worker so tasks only carry builds."""
+    global _worker_hunter_class, _worker_base_config, _worker_num_sims
+    _worker_hunter_class = hunter_class
+    _worker_base_config = base_config
+    _worker_num_sims = num_sims
+
+
+def _simulate_build_worker(build: Tuple[Tuple, Tuple]):
+    """Process pool entry point: run every sim for one (talent items, attribute items) build."""
+    config = {**_worker_base_config, "talents": dict(build[0]), "attributes": dict(build[1])}
+    return _simulate_config_worker(_worker_hunter_class, config, _worker_num_sims)
+
+
+def _init_sim_worker(hunter_class):
+    """Process pool initializer for _sim_worker: keep the run's hunter class in the worker."""
+    global _worker_hunter_class
+    _worker_hunter_class = hunter_class
+
+
+def _sim_worker(config: Dict):
+    """Process pool entry point: run one sim of a complete build config, as its SIM_RESULT_FIELDS."""
+    return _sim_result_fields(Simulation(_worker_hunter_class(config)).run())
+
+
+def _rust_config_json(hunter_class, config: Dict) -> str:
+    """Serialize a build config in the flat JSON format the Rust engine parses."""
+    return json.dumps({
+        'hunter': hunter_class.__name__ if hunter_class in (Borge, Ozzy, Knox) else "Borge",
+        'level': config.get("meta", {}).get("level", 100),
+        'stats': config.get("stats", {}),
+        'talents': config.get("talents", {}),
+        'attributes': config.get("attributes", {}),
+        'inscryptions': config.get("inscryptions", {}),
+        'mods': config.get("mods", {}),
+        'relics': config.get("relics", {}),
+        'gems': config.get("gems", {}),
+    })
+
+
+@functools.lru_cache(maxsize=None)
+def _engine_version(engine: str) -> str:
+    """Fingerprint of an engine's simulation code, so results from an older engine are never reused.
+    
+    Python hashes the sim sources; Rust hashes the installed rust_sim extension, which changes on every rebuild.
+    """
+    digest = hashlib.sha256()
+    if engine == "rust":
+        digest.update(getattr(rust_sim, "__version__", "").encode() if RUST_AVAILABLE else b"")
+        paths = [rust_sim.__file__] if RUST_AVAILABLE and getattr(rust_sim, "__file__", None) else []
+    else:
+        sim_dir = os.path.dirname(os.path.abspath(__file__))
+        paths = [os.path.join(sim_dir, name) for name in PYTHON_SIM_SOURCES]
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def _sim_cache_key(hunter_class, config: Dict, num_sims: int, engine: str) -> str:
+    """Content hash identifying one engine's aggregated result for a build config on the current engine."""
+    payload = json.dumps(config, sort_keys=True, default=str).encode()
+    payload += f"|{hunter_class.__name__}|{num_sims}|{engine}|{_engine_version(engine)}".encode()
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _sim_cache_get(key: str):
+    """Load a cached BuildResult, if present and readable; a hit marks the file recently used."""
+    path = os.path.join(SIM_CACHE_DIR, f"{key}.pkl")
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            result = pickle.load(f)
+        os.utime(path)
+        return result
+    except Exception:
+        return None
+
+
+_sim_cache_writes = itertools.count(1)
+
+
+def _sim_cache_prune():
+    """Evict the least recently used result files beyond SIM_CACHE_MAX_FILES."""
+    try:
+        entries = [entry for entry in os.scandir(SIM_CACHE_DIR) if entry.name.endswith(".pkl")]
+    except OSError:
+        return
+    excess = len(entries) - SIM_CACHE_MAX_FILES
+    if excess <= 0:
+        return
+    mtimes = []
+    for entry in entries:
+        try:
+            mtimes.append((entry.stat().st_mtime, entry.path))
+        except OSError:
+            pass
+    for _, path in heapq.nsmallest(excess, mtimes):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _sim_cache_put(key: str, result):
+    """Store an aggregated BuildResult in the cache, evicting old entries every few writes."""
+    try:
+        os.makedirs(SIM_CACHE_DIR, exist_ok=True)
+        with open(os.path.join(SIM_CACHE_DIR, f"{key}.pkl"), 'wb') as f:
+            pickle.dump(result, f)
+    except OSError:
+        return
+    if next(_sim_cache_writes) % SIM_CACHE_PRUNE_EVERY == 1:
+        _sim_cache_prune()
+
+
 class EvolutionaryOptimizer:
     """
     Genetic/evolutionary optimizer that learns from simulation results.
@@ -392,7 +705,8 @@ class EvolutionaryOptimizer:
                  population_size: int = 100,
                  elite_ratio: float = 0.1,
                  mutation_rate: float = 0.15,
-                 crossover_rate: float = 0.7):
+                 crossover_rate: float = 0.7,
+                 hall_of_fame_size: int = 20):
         self.generator = build_generator
         self.population_size = population_size
         self.elite_count = max(2, int(population_size * elite_ratio))
@@ -401,34 +715,80 @@ class EvolutionaryOptimizer:
         
         # Population tracking
         self.population: List[Dict] = []
-        self.fitness_scores: List[float] = []
+        self.fitness_scores: array = array('d')  # Parallel to population
         self.generation = 0
-        self.tested_builds: set = set()  # Track all builds we've already tested
+        self.tested_builds: set = set()  # Digests of all builds we've already tested
+        
+        # Best builds across all generations, kept as a bounded min-heap by fitness
+        self.hall_of_fame_size = hall_of_fame_size
+        self.hall_of_fame: List[Tuple[float, int, Dict]] = []
+        self._hof_counter = itertools.count()  # Tie-breaker so builds are never compared
+        
+        # Fixed gene order (attributes, then talents) so a build hashes as one flat row of levels
+        self._attr_names = tuple(build_generator.costs["attributes"])
+        self._talent_names = tuple(build_generator.costs["talents"])
+        
+        # Per-gene pattern string and the level at which it counts as "maxed",
+        # with each build's patterns cached by its hash
+        self._gene_pattern_strs = (tuple(f"attr:{a}:maxed" for a in self._attr_names)
+                                   + tuple(f"talent:{t}:maxed" for t in self._talent_names))
+        self._gene_pattern_mins = (10,) * len(self._attr_names) + (5,) * len(self._talent_names)
+        self._pattern_cache: Dict[int, Tuple[str, ...]] = {}
         
         # Learning patterns
         self.bad_patterns: Dict[str, int] = {}  # Pattern -> failure count
+        self.worthless_patterns: set = set()  # Bad patterns that reached worthless_threshold
         self.good_patterns: Dict[str, float] = {}  # Pattern -> avg fitness
         self.worthless_threshold = 10  # Failures before pattern is "worthless" (be less aggressive)
     
+    def make_candidate(self, talents: Dict[str, int], attrs: Dict[str, int]) -> Dict:
+        """Wrap a generated build, computing its level row and digest once for every later lookup."""
+        candidate = {'talents': talents, 'attributes': attrs}
+        candidate['_key'] = key = self._build_hash(candidate)
+        candidate['_digest'] = hash(key)
+        return candidate
+    
     def _build_hash(self, build: Dict) -> tuple:
-        """Create a hashable representation of a build for deduplication."""
-        attrs = tuple(sorted(build.get('attributes', {}).items()))
-        talents = tuple(sorted(build.get('talents', {}).items()))
-        return (attrs, talents)
+        """Create a hashable representation of a build for deduplication.
+        
+        Levels are read in the hunter's fixed attribute/talent order, so no per-build sort is needed.
+        """
+        key = build.get('_key')
+        if key is not None:
+            return key
+        attrs = build.get('attributes', {})
+        talents = build.get('talents', {})
+        return (*[attrs.get(a, 0) for a in self._attr_names],
+                *[talents.get(t, 0) for t in self._talent_names])
+    
+    def _build_digest(self, build: Dict) -> int:
+        """64-bit digest of _build_hash, what tested_builds stores instead of the level rows.
+        
+        A small int per build keeps the set compact across many generations; a collision
+        (which would only skip one novel build) is vanishingly unlikely at these sizes.
+        """
+        digest = build.get('_digest')
+        return hash(self._build_hash(build)) if digest is None else digest
     
     def _is_duplicate(self, build: Dict) -> bool:
         """Check if we've already tested this exact build."""
-        return self._build_hash(build) in self.tested_builds
+        return self._build_digest(build) in self.tested_builds
     
     def _mark_tested(self, build: Dict):
         """Mark a build as tested."""
-        self.tested_builds.add(self._build_hash(build))
+        self.tested_builds.add(self._build_digest(build))
+    
+    def unmark_tested(self, builds: List[Dict]):
+        """Forget builds that were generated but never simulated, so later generations can produce them again."""
+        for build in builds:
+            self.tested_builds.discard(self._build_digest(build))
         
     def initialize_population(self) -> List[Dict]:
         """Create initial diverse population with unique builds only."""
         import random
         self.population = []
         self.tested_builds = set()  # Reset for new run
+        self.hall_of_fame = []
         
         strategies = ['random', 'defensive', 'offensive', 'balanced', 'focused']
         
@@ -451,7 +811,7 @@ class EvolutionaryOptimizer:
                 builds = self.generator.generate_smart_sample(sample_size=current_batch_size, strategy=strategy)
                 
                 for talents, attrs in builds:
-                    candidate = {'talents': talents, 'attributes': attrs}
+                    candidate = self.make_candidate(talents, attrs)
                     if not self._is_duplicate(candidate):
                         self.population.append(candidate)
                         self._mark_tested(candidate)
@@ -477,7 +837,7 @@ class EvolutionaryOptimizer:
         while len(self.population) < self.population_size and attempts < max_attempts:
             builds = self.generator.generate_smart_sample(sample_size=batch_size, strategy='random')
             for talents, attrs in builds:
-                candidate = {'talents': talents, 'attributes': attrs}
+                candidate = self.make_candidate(talents, attrs)
                 if not self._is_duplicate(candidate):
                     self.population.append(candidate)
                     self._mark_tested(candidate)
@@ -492,6 +852,24 @@ class EvolutionaryOptimizer:
         self.generation = 0
         return self.population
     
+    def evaluate_population_parallel(self, sim_func, executor, workers: int, chunksize: int = None,
+                                     population: List[Dict] = None):
+        """Map sim_func over a population on a shared, long-lived executor.
+        
+        Builds are sent as plain (talent items, attribute items) tuples to keep pickling
+        cheap, and in chunks so each worker round trip carries several builds. `workers`
+        is the executor's worker count, which sizes the default chunks.
+        Returns an iterator of results in population order.
+        """
+        if population is None:
+            population = self.population
+        if chunksize is None:
+            chunksize = max(1, len(population) // (max(1, workers) * 4))
+        
+        payload = [(tuple(build.get('talents', {}).items()), tuple(build.get('attributes', {}).items()))
+                   for build in population]
+        return executor.map(sim_func, payload, chunksize=chunksize)
+    
     def evaluate_fitness(self, build: Dict, sim_result: Dict, mode: str = "Balanced") -> float:
         """
         Calculate fitness score for a build based on simulation results.
@@ -528,46 +906,57 @@ class EvolutionaryOptimizer:
         
         return max(0.001, fitness)
     
-    def update_population_fitness(self, results: List[Dict], mode: str = "Balanced"):
-        """Update fitness scores for current population."""
-        self.fitness_scores = []
+    def update_population_fitness(self, results: List[Dict], mode: str = "Balanced",
+                                  fitness_scores: array = None):
+        """Update fitness scores for current population.
         
-        for build, result in zip(self.population, results):
-            fitness = self.evaluate_fitness(build, result, mode)
-            self.fitness_scores.append(fitness)
+        Callers that already scored each result with evaluate_fitness (in `mode`)
+        can pass those scores in population order to skip scoring them again.
+        """
+        if fitness_scores is None:
+            fitness_scores = array('d', (self.evaluate_fitness(build, result, mode)
+                                         for build, result in zip(self.population, results)))
+        self.fitness_scores = fitness_scores
+        
+        hof = self.hall_of_fame
+        for build, fitness in zip(self.population, fitness_scores):
+            entry = (fitness, next(self._hof_counter), build)
+            if len(hof) < self.hall_of_fame_size:
+                heapq.heappush(hof, entry)
+            elif fitness > hof[0][0]:
+                heapq.heapreplace(hof, entry)
             
             # Learn patterns using RELATIVE thresholds based on current population
             # This is done after we have all scores
         
         # Now learn patterns using relative thresholds
-        if self.fitness_scores:
+        if len(self.fitness_scores) > 4:
+            # One C-level sort gives both quartiles; a pure-Python selection would be slower
             sorted_scores = sorted(self.fitness_scores)
             # Bottom 25% = bad, Top 25% = good
-            bad_threshold = sorted_scores[len(sorted_scores) // 4] if len(sorted_scores) > 4 else 0
-            good_threshold = sorted_scores[3 * len(sorted_scores) // 4] if len(sorted_scores) > 4 else float('inf')
+            bad_threshold = sorted_scores[len(sorted_scores) // 4]
+            good_threshold = sorted_scores[3 * len(sorted_scores) // 4]
             
             for build, result, fitness in zip(self.population, results, self.fitness_scores):
+                # The middle of the population teaches nothing, skip extracting its patterns
+                if bad_threshold < fitness < good_threshold:
+                    continue
                 self._update_patterns(build, fitness, result, bad_threshold, good_threshold)
     
-    def _extract_patterns(self, build: Dict) -> List[str]:
+    def _extract_patterns(self, build: Dict) -> Tuple[str, ...]:
         """Extract key patterns from a build for learning.
         
         Only extract very specific patterns to avoid over-filtering.
         """
-        patterns = []
-        
-        # Only track very high investment attributes (>= 10 levels)
-        attrs = build.get('attributes', {})
-        very_high_attrs = [k for k, v in attrs.items() if v >= 10]
-        for attr in very_high_attrs:
-            patterns.append(f"attr:{attr}:maxed")
-        
-        # Only track maxed talents
-        talents = build.get('talents', {})
-        maxed_talents = [k for k, v in talents.items() if v >= 5]
-        for talent in maxed_talents:
-            patterns.append(f"talent:{talent}:maxed")
-        
+        digest = self._build_digest(build)
+        patterns = self._pattern_cache.get(digest)
+        if patterns is None:
+            key = self._build_hash(build)
+            # Only track very high investment attributes (>= 10 levels) and maxed talents (>= 5)
+            strs = self._gene_pattern_strs
+            patterns = tuple([strs[i] for i, (v, lo) in enumerate(zip(key, self._gene_pattern_mins))
+                              if v >= lo])
+            self._pattern_cache[digest] = patterns
         return patterns
     
     def _update_patterns(self, build: Dict, fitness: float, result: Dict, 
@@ -580,7 +969,9 @@ class EvolutionaryOptimizer:
         
         for pattern in patterns:
             if fitness <= bad_threshold:  # Bottom 25% of population
-                self.bad_patterns[pattern] = self.bad_patterns.get(pattern, 0) + 1
+                count = self.bad_patterns[pattern] = self.bad_patterns.get(pattern, 0) + 1
+                if count >= self.worthless_threshold:
+                    self.worthless_patterns.add(pattern)
             elif fitness >= good_threshold:  # Top 25% of population
                 # Running average of fitness for good patterns
                 if pattern in self.good_patterns:
@@ -588,46 +979,27 @@ class EvolutionaryOptimizer:
                 else:
                     self.good_patterns[pattern] = fitness
     
-    def is_worthless_pattern(self, build: Dict) -> bool:
-        """Check if a build contains worthless patterns."""
+    def surrogate_upper_bound(self, build: Dict, best_good: float = None) -> float:
+        """Cheap optimistic fitness estimate from the good patterns a build contains.
+        
+        Patterns not learned as good count as the best learned value, and so does a build
+        with no tracked patterns, so no build ranks low just for lacking information.
+        Used to order a generation so the most promising builds are simulated first; it is
+        not a guaranteed bound, so the driver checks it against simulated fitness before
+        pruning on it. Pass `best_good` when scoring a whole generation at once.
+        """
+        if best_good is None:
+            best_good = max(self.good_patterns.values(), default=0.0)
         patterns = self._extract_patterns(build)
-        
-        for pattern in patterns:
-            if self.bad_patterns.get(pattern, 0) >= self.worthless_threshold:
-                return True
-        return False
+        if not patterns:
+            return best_good
+        return sum(self.good_patterns.get(p, best_good) for p in patterns)
     
-    def select_parents(self) -> List[Dict]:
-        """Select parents for next generation using tournament selection."""
-        import random
-        
-        if not self.population or not self.fitness_scores:
-            return []
-        
-        # Ensure fitness_scores and population are in sync
-        pop_size = min(len(self.population), len(self.fitness_scores))
-        if pop_size == 0:
-            return []
-        
-        parents = []
-        tournament_size = 3
-        
-        # Always include elites (but only up to what we have)
-        elite_indices = sorted(range(pop_size), 
-                               key=lambda i: self.fitness_scores[i], 
-                               reverse=True)[:min(self.elite_count, pop_size)]
-        for i in elite_indices:
-            parents.append(self.population[i])
-        
-        # Tournament selection for remaining
-        target_parents = min(self.population_size // 2, pop_size)
-        while len(parents) < target_parents:
-            tournament = random.sample(range(pop_size), 
-                                       min(tournament_size, pop_size))
-            winner = max(tournament, key=lambda i: self.fitness_scores[i])
-            parents.append(self.population[winner])
-        
-        return parents
+    def is_worthless_pattern(self, build: Dict) -> bool:
+        """Check if a build contains worthless patterns."""
+        if not self.worthless_patterns:
+            return False
+        return not self.worthless_patterns.isdisjoint(self._extract_patterns(build))
     
     def evolve_population(self) -> List[Dict]:
         """Create next generation using pure random walk generation.
@@ -654,7 +1026,7 @@ class EvolutionaryOptimizer:
             
             batch_added = 0
             for talents, attrs in builds:
-                candidate = {'talents': talents, 'attributes': attrs}
+                candidate = self.make_candidate(talents, attrs)
                 
                 # Only add if unique and not a known bad pattern
                 if not self._is_duplicate(candidate) and not self.is_worthless_pattern(candidate):
@@ -686,10 +1058,17 @@ class EvolutionaryOptimizer:
         if not self.fitness_scores:
             return []
         
-        indexed = list(enumerate(self.fitness_scores))
-        indexed.sort(key=lambda x: x[1], reverse=True)
+        scores = self.fitness_scores
+        best = heapq.nlargest(n, range(len(scores)), key=scores.__getitem__)
         
-        return [(self.population[i], score) for i, score in indexed[:n]]
+        return [(self.population[i], scores[i]) for i in best]
+    
+    def get_hall_of_fame(self, n: int = None) -> List[Tuple[Dict, float]]:
+        """Return the best builds seen across all generations, best first."""
+        ranked = sorted(self.hall_of_fame, reverse=True)
+        if n is not None:
+            ranked = ranked[:n]
+        return [(build, fitness) for fitness, _, build in ranked]
     
     def get_stats(self) -> Dict:
         """Return current optimizer statistics."""
@@ -702,7 +1081,7 @@ class EvolutionaryOptimizer:
             'avg_fitness': sum(self.fitness_scores) / len(self.fitness_scores),
             'bad_patterns': len(self.bad_patterns),
             'good_patterns': len(self.good_patterns),
-            'worthless_patterns': sum(1 for v in self.bad_patterns.values() if v >= self.worthless_threshold)
+            'worthless_patterns': len(self.worthless_patterns)
         }
 
 
@@ -739,10 +1118,15 @@ class HunterSimGUI:
         self.relic_entries: Dict[str, tk.Entry] = {}
         self.gem_entries: Dict[str, tk.Entry] = {}
         self.mod_vars: Dict[str, tk.BooleanVar] = {}
+        self._input_panels: Dict[str, Dict] = {}  # Per-hunter input forms, built once and reused
         
         # Results storage
-        self.results: List[BuildResult] = []
-        self.result_queue = queue.Queue()
+        self.results: List[BuildResult] = []  # Pruned to ranking candidates, see _record_result
+        self.valid_build_count = 0  # Every valid build this run, including pruned ones
+        self._result_memo: "OrderedDict[str, BuildResult]" = OrderedDict()  # LRU by sim cache key
+        self._result_memo_lock = threading.Lock()
+        self.result_queue = queue.SimpleQueue()  # Unbounded, lock-light FIFO: optimizer thread -> UI poller
+        self._sim_pool = None  # Worker pool shared by every _simulate_build call in a run, started lazily
         self.is_running = False
         self.stop_event = threading.Event()  # Thread-safe stop flag
         
@@ -806,14 +1190,11 @@ class HunterSimGUI:
         ttk.Button(top_frame, text="📂 Load Build", command=self._load_build).pack(side=tk.LEFT, padx=5)
         
         # Scrollable content area
-        canvas = tk.Canvas(self.input_frame)
+        canvas = self.input_canvas = tk.Canvas(self.input_frame)
         scrollbar = ttk.Scrollbar(self.input_frame, orient="vertical", command=canvas.yview)
         self.scrollable_frame = ttk.Frame(canvas)
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.scrollable_frame.bind("<Configure>", self._update_input_scrollregion)
         
         canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -827,19 +1208,49 @@ class HunterSimGUI:
         canvas.bind_all("<MouseWheel>", _on_mousewheel)
         
         self._populate_input_fields()
+    
+    def _update_input_scrollregion(self, event=None):
+        """Fit the input canvas' scroll region to its contents."""
+        self.input_canvas.configure(scrollregion=self.input_canvas.bbox("all"))
         
     def _populate_input_fields(self):
-        """Populate input fields based on selected hunter."""
-        # Clear existing
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
-        self.stat_entries.clear()
-        self.inscryption_entries.clear()
-        self.relic_entries.clear()
-        self.gem_entries.clear()
-        self.mod_vars.clear()
+        """Show the input fields for the selected hunter, reset to their defaults.
+        
+        Each hunter's form is built the first time it is shown and then only hidden
+        and re-shown, which avoids recreating dozens of Tk widgets on every switch.
+        The scroll region is recomputed once at the end rather than on every resize
+        of the form while it is being laid out.
+        """
+        self.scrollable_frame.unbind("<Configure>")
+        for panel in self._input_panels.values():
+            panel["frame"].grid_remove()
         
         hunter_name = self.current_hunter.get()
+        panel = self._input_panels.get(hunter_name)
+        if panel is None:
+            panel = self._input_panels[hunter_name] = self._build_input_panel(hunter_name)
+        else:
+            for section in ("stats", "inscryptions", "relics", "gems"):
+                for entry in panel[section].values():
+                    entry.delete(0, tk.END)
+                    entry.insert(0, "0")
+            for var in panel["mods"].values():
+                var.set(False)
+            panel["info"].configure(text=self._talent_info_text())
+        panel["frame"].grid(row=0, column=0, sticky="nsew")
+        
+        for entries, section in ((self.stat_entries, "stats"), (self.inscryption_entries, "inscryptions"),
+                                 (self.relic_entries, "relics"), (self.gem_entries, "gems"),
+                                 (self.mod_vars, "mods")):
+            entries.clear()
+            entries.update(panel[section])
+        
+        self.scrollable_frame.update_idletasks()
+        self._update_input_scrollregion()
+        self.scrollable_frame.bind("<Configure>", self._update_input_scrollregion)
+    
+    def _build_input_panel(self, hunter_name: str) -> Dict:
+        """Create the input form for one hunter and return its frame and field references."""
         if hunter_name == "Ozzy":
             hunter_class = Ozzy
         elif hunter_name == "Knox":
@@ -848,11 +1259,18 @@ class HunterSimGUI:
             hunter_class = Borge
         dummy = hunter_class.load_dummy()
         
+        panel = ttk.Frame(self.scrollable_frame)
+        stat_entries: Dict[str, tk.Entry] = {}
+        inscryption_entries: Dict[str, tk.Entry] = {}
+        relic_entries: Dict[str, tk.Entry] = {}
+        gem_entries: Dict[str, tk.Entry] = {}
+        mod_vars: Dict[str, tk.BooleanVar] = {}
+        
         # Create sections
         row = 0
         
         # Stats Section
-        stats_frame = ttk.LabelFrame(self.scrollable_frame, text="📊 Main Stats (Enter your upgrade LEVELS, not final values)")
+        stats_frame = ttk.LabelFrame(panel, text="📊 Main Stats (Enter your upgrade LEVELS, not final values)")
         stats_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         row += 1
         
@@ -892,10 +1310,10 @@ class HunterSimGUI:
             entry = ttk.Entry(frame, width=8)
             entry.insert(0, "0")
             entry.pack(side=tk.LEFT)
-            self.stat_entries[stat_key] = entry
+            stat_entries[stat_key] = entry
         
         # Inscryptions Section
-        inscr_frame = ttk.LabelFrame(self.scrollable_frame, text="📜 Inscryptions (Enter your levels)")
+        inscr_frame = ttk.LabelFrame(panel, text="📜 Inscryptions (Enter your levels)")
         inscr_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         row += 1
         
@@ -910,10 +1328,10 @@ class HunterSimGUI:
             entry = ttk.Entry(frame, width=6)
             entry.insert(0, "0")
             entry.pack(side=tk.LEFT)
-            self.inscryption_entries[inscr_key] = entry
+            inscryption_entries[inscr_key] = entry
         
         # Relics Section
-        relics_frame = ttk.LabelFrame(self.scrollable_frame, text="🏆 Relics (Enter your levels)")
+        relics_frame = ttk.LabelFrame(panel, text="🏆 Relics (Enter your levels)")
         relics_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         row += 1
         
@@ -925,10 +1343,10 @@ class HunterSimGUI:
             entry = ttk.Entry(frame, width=6)
             entry.insert(0, "0")
             entry.pack(side=tk.LEFT)
-            self.relic_entries[relic_key] = entry
+            relic_entries[relic_key] = entry
         
         # Gems Section
-        gems_frame = ttk.LabelFrame(self.scrollable_frame, text="💎 Gems (Enter 0 or 1, or level for attraction gems)")
+        gems_frame = ttk.LabelFrame(panel, text="💎 Gems (Enter 0 or 1, or level for attraction gems)")
         gems_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         row += 1
         
@@ -941,11 +1359,11 @@ class HunterSimGUI:
             entry = ttk.Entry(frame, width=6)
             entry.insert(0, "0")
             entry.pack(side=tk.LEFT)
-            self.gem_entries[gem_key] = entry
+            gem_entries[gem_key] = entry
         
         # Mods Section (if applicable)
         if dummy.get("mods"):
-            mods_frame = ttk.LabelFrame(self.scrollable_frame, text="⚙️ Mods")
+            mods_frame = ttk.LabelFrame(panel, text="⚙️ Mods")
             mods_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
             row += 1
             
@@ -954,14 +1372,29 @@ class HunterSimGUI:
                 label = mod_key.replace("_", " ").title()
                 cb = ttk.Checkbutton(mods_frame, text=label, variable=var)
                 cb.grid(row=0, column=i, padx=10, pady=5)
-                self.mod_vars[mod_key] = var
+                mod_vars[mod_key] = var
         
         # Info section about talents/attributes
-        info_frame = ttk.LabelFrame(self.scrollable_frame, text="ℹ️ Talents & Attributes (AUTOMATICALLY OPTIMIZED)")
+        info_frame = ttk.LabelFrame(panel, text="ℹ️ Talents & Attributes (AUTOMATICALLY OPTIMIZED)")
         info_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=10, pady=5)
         row += 1
         
-        info_text = """
+        info_label = ttk.Label(info_frame, text=self._talent_info_text(), justify=tk.LEFT, wraplength=800)
+        info_label.pack(padx=10, pady=10)
+        
+        return {
+            "frame": panel,
+            "stats": stat_entries,
+            "inscryptions": inscryption_entries,
+            "relics": relic_entries,
+            "gems": gem_entries,
+            "mods": mod_vars,
+            "info": info_label,
+        }
+    
+    def _talent_info_text(self) -> str:
+        """Explain the automatic talent/attribute search for the current level."""
+        return """
 The optimizer will automatically test different combinations of talents and attributes to find the best builds.
 
 Based on your level, you have:
@@ -975,9 +1408,7 @@ The system will explore combinations and rank them by different criteria:
 • Most Damage Dealt
 • Best Survival Rate
         """.format(talent_pts=self.hunter_level.get(), attr_pts=self.hunter_level.get() * 3)
-        
-        ttk.Label(info_frame, text=info_text, justify=tk.LEFT, wraplength=800).pack(padx=10, pady=10)
-        
+    
     def _get_inscryption_tooltips(self, hunter: str) -> Dict[str, str]:
         """Get tooltip descriptions for inscryptions."""
         if hunter == "Borge":
@@ -1064,10 +1495,21 @@ The system will explore combinations and rank them by different criteria:
             title="Save Build Configuration"
         )
         
-        if filename:
-            with open(filename, 'w') as f:
-                json.dump(config, f, indent=2)
-            messagebox.showinfo("Saved", f"Build saved to:\n{filename}")
+        if not filename:
+            return
+        
+        # Write in the background so a slow disk never stalls the UI
+        def write():
+            try:
+                with open(filename, 'w') as f:
+                    json.dump(config, f, indent=2)
+            except Exception as e:
+                message = f"Failed to save build:\n{str(e)}"
+                self.root.after(0, lambda: messagebox.showerror("Error", message))
+                return
+            self.root.after(0, lambda: messagebox.showinfo("Saved", f"Build saved to:\n{filename}"))
+        
+        threading.Thread(target=write, daemon=True).start()
     
     def _load_build(self):
         """Load a build configuration from a JSON file."""
@@ -1078,11 +1520,23 @@ The system will explore combinations and rank them by different criteria:
         
         if not filename:
             return
-            
+        
+        # Read in the background, then fill in the form back on the UI thread
+        def read():
+            try:
+                with open(filename, 'r') as f:
+                    config = json.load(f)
+            except Exception as e:
+                message = f"Failed to load build:\n{str(e)}"
+                self.root.after(0, lambda: messagebox.showerror("Error", message))
+                return
+            self.root.after(0, lambda: self._apply_loaded_build(config, filename))
+        
+        threading.Thread(target=read, daemon=True).start()
+    
+    def _apply_loaded_build(self, config: Dict, filename: str):
+        """Fill the input fields from a loaded build configuration."""
         try:
-            with open(filename, 'r') as f:
-                config = json.load(f)
-            
             # Set hunter and level
             if config.get("hunter"):
                 self.current_hunter.set(config["hunter"])
@@ -1192,14 +1646,33 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         self.advisor_results.configure(state=tk.NORMAL)
         self.advisor_results.delete(1.0, tk.END)
         
+        # Read the input form and settings here on the UI thread; Tk variables are not
+        # safe to read from the analysis thread, which only gets these snapshots
+        try:
+            base_config = self._get_current_config()
+            settings = AdvisorSettings(
+                hunter_name=self.current_hunter.get(),
+                num_sims=self.advisor_sims.get(),
+                num_procs=self.num_processes.get(),
+                use_rust=self.use_rust.get() and RUST_AVAILABLE,
+                use_best_build=self.advisor_use_best.get(),
+                stat_keys=tuple(self.stat_entries),
+            )
+        except tk.TclError as e:
+            self._show_advisor_error(f"Invalid input: {str(e)}")
+            return
+        
         # Run in background thread
-        thread = threading.Thread(target=self._analyze_upgrades, daemon=True)
+        thread = threading.Thread(target=self._analyze_upgrades, args=(settings, base_config), daemon=True)
         thread.start()
     
-    def _analyze_upgrades(self):
-        """Analyze which stat upgrade is best (runs in background)."""
+    def _analyze_upgrades(self, settings: AdvisorSettings, base_config: Dict):
+        """Analyze which stat upgrade is best (runs in background).
+        
+        `base_config` is the current input form, talents and attributes included.
+        """
         try:
-            hunter_name = self.current_hunter.get()
+            hunter_name = settings.hunter_name
             if hunter_name == "Ozzy":
                 hunter_class = Ozzy
             elif hunter_name == "Knox":
@@ -1207,48 +1680,41 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
             else:
                 hunter_class = Borge
             
-            # Build base config INCLUDING current talents and attributes
-            base_config = self._get_current_config()
-            
             # If "use best build" is enabled and we have optimizer results, use the best build
-            if self.advisor_use_best.get() and self.results:
+            if settings.use_best_build and self.results:
                 # Find best build by avg stage
-                best_result = max(self.results, key=lambda r: r.avg_final_stage)
+                best_result = max(self.results, key=attrgetter('avg_final_stage'))
                 base_config["talents"] = best_result.talents
                 base_config["attributes"] = best_result.attributes
                 self.root.after(0, lambda: self.advisor_status.configure(
                     text=f"Using best build (avg {best_result.avg_final_stage:.1f} stages)..."))
             
-            num_sims = self.advisor_sims.get()
-            use_rust = self.use_rust.get() and RUST_AVAILABLE
+            num_sims = settings.num_sims
+            use_rust = settings.use_rust
             
-            # First, simulate the baseline
-            self.root.after(0, lambda: self.advisor_status.configure(text="Simulating baseline..."))
-            if use_rust:
-                baseline = self._simulate_build_rust(hunter_class, base_config, num_sims)
-            else:
-                baseline = self._simulate_build_sequential(hunter_class, base_config, num_sims)
+            # Simulate the baseline and every +1 stat variant in one batch
+            stat_keys = settings.stat_keys
+            configs = [base_config]
+            for stat in stat_keys:
+                test_config = _clone_config(base_config)
+                test_config["stats"][stat] = test_config["stats"].get(stat, 0) + 1
+                configs.append(test_config)
+            
+            self.root.after(0, lambda: self.advisor_status.configure(
+                text=f"Simulating baseline and {len(stat_keys)} stat upgrades..."))
+            baseline, *stat_results = self._simulate_builds_batch(
+                hunter_class, configs, num_sims, use_rust, num_procs=settings.num_procs)
             
             if not baseline:
                 self.root.after(0, lambda: self._show_advisor_error("Could not simulate baseline build"))
                 return
             
-            # Test each stat upgrade
-            stat_keys = list(self.stat_entries.keys())
+            # Test each stat upgrade, keeping each resource category's top 3 as the results arrive.
+            # Heap entries are (score, -stat index, result) so equal scores keep the earlier stat.
             results = []
+            top_by_category = {cat: [] for cat in RESOURCE_CATEGORIES}
             
-            for i, stat in enumerate(stat_keys):
-                self.root.after(0, lambda s=stat, i=i: self.advisor_status.configure(
-                    text=f"Testing +1 {s}... ({i+1}/{len(stat_keys)})"))
-                
-                test_config = copy.deepcopy(base_config)
-                test_config["stats"][stat] = test_config["stats"].get(stat, 0) + 1
-                
-                if use_rust:
-                    result = self._simulate_build_rust(hunter_class, test_config, num_sims)
-                else:
-                    result = self._simulate_build_sequential(hunter_class, test_config, num_sims)
-                    
+            for i, (stat, result) in enumerate(zip(stat_keys, stat_results)):
                 if result:
                     # Calculate improvements
                     stage_improvement = result.avg_final_stage - baseline.avg_final_stage
@@ -1264,7 +1730,7 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
                         survival_improvement * 2   # Survival is good
                     )
                     
-                    results.append({
+                    entry = {
                         "stat": stat,
                         "stage_improvement": stage_improvement,
                         "loot_improvement": loot_improvement,
@@ -1272,13 +1738,23 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
                         "survival_improvement": survival_improvement,
                         "score": score,
                         "result": result
-                    })
+                    }
+                    results.append(entry)
+                    
+                    top = top_by_category.get(STAT_TO_CATEGORY.get(stat))
+                    if top is not None:
+                        if len(top) < 3:
+                            heapq.heappush(top, (score, -i, entry))
+                        elif (score, -i) > top[0][:2]:
+                            heapq.heapreplace(top, (score, -i, entry))
             
             # Sort by score
-            results.sort(key=lambda x: x["score"], reverse=True)
+            results.sort(key=itemgetter("score"), reverse=True)
+            top_results = {cat: [entry for _, _, entry in sorted(top, reverse=True)]
+                           for cat, top in top_by_category.items()}
             
             # Display results
-            self.root.after(0, lambda: self._display_advisor_results(baseline, results))
+            self.root.after(0, lambda: self._display_advisor_results(baseline, results, top_results))
             
         except Exception as e:
             import traceback
@@ -1293,28 +1769,17 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         self.advisor_btn.configure(state=tk.NORMAL)
         self.advisor_status.configure(text="")
     
-    def _display_advisor_results(self, baseline, results):
-        """Display the upgrade advisor results grouped by resource type."""
+    def _display_advisor_results(self, baseline, results, top_by_category: Dict[str, List[Dict]]):
+        """Display the upgrade advisor results grouped by resource type.
+        
+        `results` must already be sorted by score, best first, and `top_by_category`
+        holds each resource category's best three of them in the same order.
+        """
         self.advisor_results.configure(state=tk.NORMAL)
         self.advisor_results.delete(1.0, tk.END)
         
         text = self.advisor_results
         
-        # Define resource categories (same for all hunters)
-        resource_categories = {
-            "Common Resource": ["hp", "power", "regeneration"],
-            "Rare Resource": ["dr", "evade", "effect"],
-            "Very Rare Resource": ["special_chance", "crit_chance", "special_damage", "crit_damage", "speed"]
-        }
-        
-        # Group results by resource
-        grouped_results = {cat: [] for cat in resource_categories}
-        for r in results:
-            for category, stats in resource_categories.items():
-                if r["stat"] in stats:
-                    grouped_results[category].append(r)
-                    break
-        
         text.insert(tk.END, "=" * 70 + "\n")
         text.insert(tk.END, "🎯 UPGRADE ADVISOR RESULTS\n")
         text.insert(tk.END, "=" * 70 + "\n\n")
@@ -1351,7 +1816,7 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         
         for category in ["Common Resource", "Rare Resource", "Very Rare Resource"]:
             icon = resource_icons[category]
-            category_results = grouped_results[category]
+            category_results = top_by_category[category]
             
             if not category_results:
                 continue
@@ -1359,10 +1824,7 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
             text.insert(tk.END, f"{icon} {category.upper()}\n")
             text.insert(tk.END, "-" * 70 + "\n")
             
-            # Sort by score within category
-            category_results.sort(key=lambda x: x["score"], reverse=True)
-            
-            for i, r in enumerate(category_results[:3], 1):  # Top 3 per category
+            for i, r in enumerate(category_results, 1):
                 stat_name = r["stat"].replace("_", " ").title()
                 text.insert(tk.END, f"  {i}. +1 {stat_name}\n")
                 text.insert(tk.END, f"     Stage: {r['stage_improvement']:+.2f}")
@@ -1543,7 +2005,14 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
                    command=self._copy_results).pack(side=tk.LEFT, padx=5)
     
     def _log(self, message: str):
-        """Add a message to the log."""
+        """Add a message to the log.
+        
+        Lines logged from the optimizer thread are queued instead, so the poller writes
+        everything since its last tick with one insert, in order with the other messages.
+        """
+        if threading.current_thread() is not threading.main_thread():
+            self.result_queue.put(('log', message, None, None))
+            return
         self.log_text.configure(state=tk.NORMAL)
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
@@ -1601,11 +2070,31 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         """Start the optimization process."""
         if self.is_running:
             return
+        
+        # Snapshot the settings and input form here, so the background thread never reads Tk
+        try:
+            base_config = self._get_current_config()
+            settings = RunSettings(
+                hunter_name=self.current_hunter.get(),
+                level=self.hunter_level.get(),
+                num_sims=self.num_sims_per_build.get(),
+                num_procs=self.num_processes.get(),
+                use_rust=self.use_rust.get() and RUST_AVAILABLE,
+                use_evolutionary=self.use_evolutionary.get(),
+                use_progressive=self.use_progressive.get(),
+                population_size=self.evo_population.get(),
+                max_builds=self.max_builds_to_test.get(),
+            )
+        except tk.TclError as e:
+            messagebox.showerror("Error", f"Invalid optimization settings:\n{str(e)}")
+            return
             
         self.is_running = True
         self.stop_event.clear()  # Reset stop flag
         self.results.clear()
+        self.valid_build_count = 0
         self.optimization_start_time = time.time()  # Track start time
+        self._last_progress_post = 0.0
         
         # Reset best tracking
         self.best_max_stage = 0
@@ -1624,7 +2113,7 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         self.log_text.configure(state=tk.DISABLED)
         
         # Start optimization in background thread
-        thread = threading.Thread(target=self._run_optimization, daemon=True)
+        thread = threading.Thread(target=self._run_optimization, args=(settings, base_config), daemon=True)
         thread.start()
         
         # Start polling for results
@@ -1635,50 +2124,53 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         self.stop_event.set()  # Thread-safe signal
         self._log("⏹️ Stopping optimization...")
         
-    def _run_optimization(self):
-        """Run the optimization (in background thread)."""
+    def _run_optimization(self, settings: RunSettings, base_config: Dict):
+        """Run the optimization (in background thread) from the input form's config."""
         try:
-            hunter_name = self.current_hunter.get()
+            hunter_name = settings.hunter_name
             if hunter_name == "Ozzy":
                 hunter_class = Ozzy
             elif hunter_name == "Knox":
                 hunter_class = Knox
             else:
                 hunter_class = Borge
-            level = self.hunter_level.get()
+            level = settings.level
             
             self._log(f"🚀 Starting optimization for {hunter_name} at level {level}")
             self._log(f"   Talent points available: {level}")
             self._log(f"   Attribute points available: {level * 3}")
             
-            # Get base config
-            base_config = self._get_current_config()
-            
             # Check if using evolutionary mode
-            use_evolutionary = self.use_evolutionary.get()
-            use_progressive = self.use_progressive.get()
+            use_evolutionary = settings.use_evolutionary
+            use_progressive = settings.use_progressive
             
             if use_evolutionary and level >= 30:
                 if use_progressive:
                     # Use progressive evolution (curriculum learning)
-                    self._run_progressive_evolution(hunter_class, level, base_config)
+                    self._run_progressive_evolution(hunter_class, level, base_config, settings)
                 else:
                     # Use standard evolutionary optimizer
-                    self._run_evolutionary_optimization(hunter_class, level, base_config)
+                    self._run_evolutionary_optimization(hunter_class, level, base_config, settings)
             else:
                 # Use traditional sampling optimization
-                self._run_sampling_optimization(hunter_class, level, base_config)
+                self._run_sampling_optimization(hunter_class, level, base_config, settings)
                 
         except Exception as e:
             self._log(f"\n❌ Error during optimization: {str(e)}")
             import traceback
             self._log(traceback.format_exc())
             self.result_queue.put(('error', str(e), None, None))
+        finally:
+            # Started by the first _simulate_build of the run, if any
+            if self._sim_pool is not None:
+                self._sim_pool.shutdown(cancel_futures=True)
+                self._sim_pool = None
     
-    def _run_evolutionary_optimization(self, hunter_class, level: int, base_config: Dict):
+    def _run_evolutionary_optimization(self, hunter_class, level: int, base_config: Dict,
+                                       settings: RunSettings):
         """Run evolutionary/genetic optimization that learns from results."""
-        import copy
         import random
+        stop_requested = self.stop_event.is_set  # Bound once; checked per build
         
         self._log("\n🧬 Using Evolutionary Optimizer")
         self._log("   This mode learns from simulation results to find better builds faster")
@@ -1686,7 +2178,7 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         generator = BuildGenerator(hunter_class, level)
         optimizer = EvolutionaryOptimizer(
             generator, 
-            population_size=self.evo_population.get(),
+            population_size=settings.population_size,
             elite_ratio=0.15,
             mutation_rate=0.2,
             crossover_rate=0.7
@@ -1694,9 +2186,12 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         
         # Use 6 generations to match the 6 tiers in progressive mode
         num_generations = 6
-        num_sims = self.num_sims_per_build.get()
-        num_procs = self.num_processes.get()
-        use_rust = self.use_rust.get() and RUST_AVAILABLE
+        num_sims = settings.num_sims
+        num_procs = settings.num_procs
+        use_rust = settings.use_rust
+        engine = "rust" if use_rust else "python"
+        # Every build in the run shares base_config, so the Rust engine parses it once
+        rust_session = self._open_rust_session(hunter_class, base_config) if use_rust else None
         
         # Max builds to test = population × generations
         # This allows testing many unique builds instead of evolving the same population
@@ -1718,131 +2213,224 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         total_tested = 0
         all_tested_builds = []  # Track all builds we've tested
         
-        for gen in range(num_generations):
-            if self.stop_event.is_set():
-                self._log('\n⏹️ Optimization stopped by user.')
-                break
-            
-            # Check if we've hit our target
-            if total_tested >= max_builds_to_test:
-                self._log(f'\n✅ Reached max builds limit ({max_builds_to_test})')
-                break
-            
-            self._log(f"\n🔄 Generation {gen + 1}/{num_generations} (tested {total_tested}/{max_builds_to_test} builds so far)")
-            
-            # Evaluate current population
-            gen_results = []
-            for i, build in enumerate(population):
-                if self.stop_event.is_set():
+        # One pool for the whole run, so workers are spawned once rather than per build.
+        # The base config is handed to each worker once up front; tasks only carry the builds.
+        executor = None
+        if not use_rust and num_procs > 1:
+            executor = ProcessPoolExecutor(max_workers=num_procs, initializer=_init_build_worker,
+                                           initargs=(hunter_class, base_config, num_sims))
+            sim_func = _simulate_build_worker
+        
+        try:
+            for gen in range(num_generations):
+                if stop_requested():
+                    self._log('\n⏹️ Optimization stopped by user.')
                     break
                 
+                # Check if we've hit our target
                 if total_tested >= max_builds_to_test:
+                    self._log(f'\n✅ Reached max builds limit ({max_builds_to_test})')
                     break
                 
-                # Create config for this build
-                config = copy.deepcopy(base_config)
-                config["talents"] = build.get('talents', {})
-                config["attributes"] = build.get('attributes', {})
+                self._log(f"\n🔄 Generation {gen + 1}/{num_generations} (tested {total_tested}/{max_builds_to_test} builds so far)")
                 
-                try:
-                    # Run simulations
-                    if use_rust:
-                        result = self._simulate_build_rust(hunter_class, config, num_sims)
-                    else:
-                        result = self._simulate_build(hunter_class, config, num_sims, num_procs)
+                # Once patterns are learned, simulate the most promising builds first. The rest of
+                # the generation is skipped once their estimates fall below the worst fitness found,
+                # but only while the estimate has held as an upper bound on every build simulated
+                prune = bool(optimizer.good_patterns)
+                estimates = None
+                if prune:
+                    best_good = max(optimizer.good_patterns.values())
+                    scored = sorted(((optimizer.surrogate_upper_bound(build, best_good), build) for build in population),
+                                    key=itemgetter(0), reverse=True)
+                    estimates = [estimate for estimate, _ in scored]
+                    population = [build for _, build in scored]
+                min_prune_count = optimizer.elite_count * 3
+                worst_fitness = float('inf')
+                bound_held = True
+                
+                # Builds simulated by an earlier run with the same config are loaded, not rerun
+                to_test = population[:max_builds_to_test - total_tested]
+                configs = []
+                cache_keys = []
+                cached = {}
+                for i, build in enumerate(to_test):
+                    # Sims only read their config, so every build shares base_config's other sections
+                    config = {**base_config, "talents": build.get('talents', {}),
+                              "attributes": build.get('attributes', {})}
+                    configs.append(config)
+                    cache_keys.append(_sim_cache_key(hunter_class, config, num_sims, engine))
+                    result = self._memo_get(cache_keys[i])
+                    if result is None:
+                        result = _sim_cache_get(cache_keys[i])
+                    if result is not None:
+                        cached[i] = result
+                if cached:
+                    self._log(f"   📂 {len(cached)} builds loaded from the sim cache")
+                
+                # Rust engine: uncached builds are simulated a block at a time, one FFI call per block.
+                # While pruning, blocks stay small so little is simulated past the cut-off.
+                rust_results = {}
+                rust_block = min_prune_count if prune else RUST_BATCH_SIZE
+                
+                # Python engine: stream the generation's uncached builds through the shared pool
+                pool_results = None
+                if executor is not None:
+                    pool_results = optimizer.evaluate_population_parallel(
+                        sim_func, executor, num_procs,
+                        population=[build for i, build in enumerate(to_test) if i not in cached])
+                
+                # Evaluate current population, keeping running stage/boss 1 totals for the summary
+                gen_results = []
+                gen_fitness = array('d')  # Each result's fitness, scored once as it arrives
+                alive_count = 0
+                stage_sum = boss1_sum = 0.0
+                max_stage = 0
+                for i, build in enumerate(population):
+                    if stop_requested():
+                        break
                     
-                    if result:
-                        self.results.append(result)
-                        gen_results.append({
-                            'avg_stage': result.avg_final_stage,
-                            'loot_per_hour': result.avg_loot_per_hour,
-                            'survival_rate': result.survival_rate if hasattr(result, 'survival_rate') else (1.0 if result.avg_final_stage > 0 else 0.0),
-                            'boss1_survival': result.boss1_survival if hasattr(result, 'boss1_survival') else 0,
-                            'boss2_survival': result.boss2_survival if hasattr(result, 'boss2_survival') else 0,
-                            'boss3_survival': result.boss3_survival if hasattr(result, 'boss3_survival') else 0,
-                            'total_damage': result.avg_damage if hasattr(result, 'avg_damage') else 0,
-                            'clear_time': result.avg_elapsed_time if hasattr(result, 'avg_elapsed_time') else 100,
-                            'died_early': False  # Explicitly mark as successful
-                        })
-                    else:
-                        gen_results.append({'died_early': True})
-                except Exception:
-                    gen_results.append({'died_early': True})
+                    if total_tested >= max_builds_to_test:
+                        break
+                    
+                    if (prune and bound_held and i >= min_prune_count
+                            and 0 < estimates[i] < worst_fitness):
+                        self._log(f"   Skipping {len(population) - i} builds whose pattern estimate "
+                                  f"is below this generation's worst fitness")
+                        # Not simulated, so a later generation may still generate and test them
+                        optimizer.unmark_tested(population[i:])
+                        break
+                    
+                    config = configs[i]
+                    
+                    try:
+                        # Run simulations
+                        if i in cached:
+                            result = cached[i]
+                        else:
+                            if use_rust:
+                                if i not in rust_results:
+                                    block = [j for j in range(i, min(len(to_test), i + rust_block)) if j not in cached]
+                                    rust_results = dict(zip(block, self._simulate_builds_batch(
+                                        hunter_class, [configs[j] for j in block], num_sims, True,
+                                        keys=[cache_keys[j] for j in block], session=rust_session)))
+                                result = rust_results.pop(i)
+                            elif pool_results is not None:
+                                results_list = next(pool_results)
+                                result = self._aggregate_results(config, results_list) if results_list else None
+                            else:
+                                result = self._simulate_build(hunter_class, config, num_sims, num_procs)
+                            if result:
+                                _sim_cache_put(cache_keys[i], result)
+                        if result:
+                            self._memo_put(cache_keys[i], result)
+                        
+                        if result:
+                            self._record_result(result)
+                            gen_results.append({
+                                'avg_stage': result.avg_final_stage,
+                                'loot_per_hour': result.avg_loot_per_hour,
+                                'survival_rate': result.survival_rate if hasattr(result, 'survival_rate') else (1.0 if result.avg_final_stage > 0 else 0.0),
+                                'boss1_survival': result.boss1_survival if hasattr(result, 'boss1_survival') else 0,
+                                'boss2_survival': result.boss2_survival if hasattr(result, 'boss2_survival') else 0,
+                                'boss3_survival': result.boss3_survival if hasattr(result, 'boss3_survival') else 0,
+                                'total_damage': result.avg_damage if hasattr(result, 'avg_damage') else 0,
+                                'clear_time': result.avg_elapsed_time if hasattr(result, 'avg_elapsed_time') else 100,
+                                'died_early': False  # Explicitly mark as successful
+                            })
+                            alive_count += 1
+                            stage_sum += result.avg_final_stage
+                            boss1_sum += result.boss1_survival
+                            if result.avg_final_stage > max_stage:
+                                max_stage = result.avg_final_stage
+                        else:
+                            gen_results.append(FAILED_BUILD_RESULT)
+                    except Exception:
+                        gen_results.append(FAILED_BUILD_RESULT)
+                    
+                    fitness = optimizer.evaluate_fitness(build, gen_results[-1], "Balanced")
+                    gen_fitness.append(fitness)
+                    if fitness < worst_fitness:
+                        worst_fitness = fitness
+                    if prune and fitness > estimates[i]:
+                        bound_held = False  # The estimate under-shot a real build; stop trusting it this generation
+                    total_tested += 1
+                    progress = min(100, (total_tested / max_builds_to_test) * 100)
+                    self._post_progress(progress, total_tested, max_builds_to_test)
+                    
+                    # Log progress within generation every 10% or 100 builds
+                    log_interval = max(100, len(population) // 10)
+                    if (i + 1) % log_interval == 0:
+                        elapsed = time.time() - self.optimization_start_time
+                        rate = total_tested / elapsed if elapsed > 0 else 0
+                        self.result_queue.put(('log', f"   ...{i+1}/{len(population)} builds in gen {gen+1} ({rate:.1f} builds/sec)", None, None))
                 
-                total_tested += 1
-                progress = min(100, (total_tested / max_builds_to_test) * 100)
-                self.result_queue.put(('progress', progress, total_tested, max_builds_to_test))
+                if pool_results is not None:
+                    pool_results.close()  # Cancels any builds still queued in the pool
                 
-                # Log progress within generation every 10% or 100 builds
-                log_interval = max(100, len(population) // 10)
-                if (i + 1) % log_interval == 0:
-                    elapsed = time.time() - self.optimization_start_time
-                    rate = total_tested / elapsed if elapsed > 0 else 0
-                    self.result_queue.put(('log', f"   ...{i+1}/{len(population)} builds in gen {gen+1} ({rate:.1f} builds/sec)", None, None))
-            
-            # Only process results for builds we actually tested
-            gen_results = gen_results[:len(population)]
-            
-            # Update fitness scores
-            optimizer.update_population_fitness(gen_results, "Balanced")
-            stats = optimizer.get_stats()
-            
-            # Collect stats from this generation for debugging
-            stages = [r.get('avg_stage', 0) for r in gen_results if not r.get('died_early', False)]
-            boss1_rates = [r.get('boss1_survival', 0) for r in gen_results if not r.get('died_early', False)]
-            
-            if stages:
-                avg_stage = sum(stages) / len(stages)
-                max_stage = max(stages)
-                avg_boss1 = sum(boss1_rates) / len(boss1_rates) if boss1_rates else 0
-                self._log(f"   Stages: avg={avg_stage:.1f}, max={max_stage:.1f}, boss1={avg_boss1:.1%}")
+                # Score (and learn patterns from) the builds this generation actually tested
+                optimizer.population = population[:len(gen_results)]
                 
-                # Send best update to UI
-                self.result_queue.put(('best_update', {
-                    'best_max': int(max_stage),
-                    'best_avg': avg_stage,
-                    'gen': gen + 1
-                }, None, None))
-            
-            self._log(f"   Best fitness: {stats['best_fitness']:.4f}, Avg: {stats['avg_fitness']:.4f}")
-            self._log(f"   Patterns: {stats['bad_patterns']} bad, {stats['good_patterns']} good, {stats['worthless_patterns']} worthless")
-            
-            # Get best build from this generation
-            best_builds = optimizer.get_best_builds(1)
-            if best_builds:
-                best_build, best_fitness = best_builds[0]
-                self._log(f"   Current best: fitness={best_fitness:.2f}")
-            
-            # Generate NEW unique builds for next generation (unless last gen or at limit)
-            if gen < num_generations - 1 and total_tested < max_builds_to_test:
-                self._log(f"   Generating new unique builds for next generation...")
+                # Update fitness scores
+                optimizer.update_population_fitness(gen_results, "Balanced", gen_fitness)
+                stats = optimizer.get_stats()
+                
+                # Summarize this generation for debugging
+                if alive_count:
+                    avg_stage = stage_sum / alive_count
+                    avg_boss1 = boss1_sum / alive_count
+                    self._log(f"   Stages: avg={avg_stage:.1f}, max={max_stage:.1f}, boss1={avg_boss1:.1%}")
+                    
+                    # Send best update to UI
+                    self.result_queue.put(('best_update', {
+                        'best_max': int(max_stage),
+                        'best_avg': avg_stage,
+                        'gen': gen + 1
+                    }, None, None))
                 
-                # Try to generate a full population of new builds
-                new_population = []
-                max_attempts = optimizer.population_size * 20  # Try harder to find new builds
-                attempts = 0
+                self._log(f"   Best fitness: {stats['best_fitness']:.4f}, Avg: {stats['avg_fitness']:.4f}")
+                self._log(f"   Patterns: {stats['bad_patterns']} bad, {stats['good_patterns']} good, {stats['worthless_patterns']} worthless")
                 
-                while len(new_population) < optimizer.population_size and attempts < max_attempts:
-                    # Use learned patterns to guide generation
-                    strategy = random.choice(['random', 'defensive', 'offensive', 'balanced', 'focused'])
-                    builds = optimizer.generator.generate_smart_sample(sample_size=50, strategy=strategy)
+                # Get best build from this generation
+                best_builds = optimizer.get_best_builds(1)
+                if best_builds:
+                    best_build, best_fitness = best_builds[0]
+                    self._log(f"   Current best: fitness={best_fitness:.2f}")
+                
+                # Generate NEW unique builds for next generation (unless last gen or at limit)
+                if gen < num_generations - 1 and total_tested < max_builds_to_test:
+                    self._log(f"   Generating new unique builds for next generation...")
                     
-                    for talents, attrs in builds:
-                        candidate = {'talents': talents, 'attributes': attrs}
-                        if not optimizer._is_duplicate(candidate):
-                            new_population.append(candidate)
-                            optimizer._mark_tested(candidate)
-                            if len(new_population) >= optimizer.population_size:
-                                break
+                    # Try to generate a full population of new builds
+                    new_population = []
+                    max_attempts = optimizer.population_size * 20  # Try harder to find new builds
+                    attempts = 0
                     
-                    attempts += 50
-                
-                if new_population:
-                    population = new_population
-                    self._log(f"   Generated {len(population)} new unique builds for next generation")
-                else:
-                    self._log(f"   ⚠️ Build space exhausted - no more unique builds to test")
-                    break  # Exit early, we've tested everything possible
+                    while len(new_population) < optimizer.population_size and attempts < max_attempts:
+                        # Use learned patterns to guide generation. Only walk as many builds as
+                        # could still be admitted, so none are generated just to be thrown away.
+                        strategy = random.choice(['random', 'defensive', 'offensive', 'balanced', 'focused'])
+                        sample_size = min(50, optimizer.population_size - len(new_population))
+                        builds = optimizer.generator.generate_smart_sample(sample_size=sample_size, strategy=strategy)
+                        
+                        for talents, attrs in builds:
+                            candidate = optimizer.make_candidate(talents, attrs)
+                            if not optimizer._is_duplicate(candidate):
+                                new_population.append(candidate)
+                                optimizer._mark_tested(candidate)
+                        
+                        attempts += sample_size
+                    
+                    if new_population:
+                        population = new_population
+                        self._log(f"   Generated {len(population)} new unique builds for next generation")
+                    else:
+                        self._log(f"   ⚠️ Build space exhausted - no more unique builds to test")
+                        break  # Exit early, we've tested everything possible
+            
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
         
         # Final summary - use actual generations completed
         actual_generations = gen + 1  # gen is 0-indexed
@@ -1852,7 +2440,10 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         self._log(f"\n✅ Evolutionary optimization complete!")
         self._log(f"   Tested {total_tested:,} unique builds across {actual_generations} generations")
         self._log(f"   Time: {total_time:.1f}s ({rate:.1f} builds/sec)")
-        self._log(f"   Found {len(self.results):,} valid builds")
+        self._log(f"   Found {self.valid_build_count:,} valid builds")
+        hall_of_fame = optimizer.get_hall_of_fame(1)
+        if hall_of_fame:
+            self._log(f"   Best fitness across all generations: {hall_of_fame[0][1]:.4f}")
         
         final_stats = optimizer.get_stats()
         self._log(f"\n📈 Optimizer learned:")
@@ -1862,7 +2453,8 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         
         self.result_queue.put(('done', None, None, None))
     
-    def _run_progressive_evolution(self, hunter_class, level: int, base_config: Dict):
+    def _run_progressive_evolution(self, hunter_class, level: int, base_config: Dict,
+                                   settings: RunSettings):
         """Run progressive evolution - start with few points, find what works, scale up.
         
         This mimics how a player would level up and allocate points:
@@ -1872,8 +2464,8 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         
         Much more efficient than random walk over full space.
         """
-        import copy
         import random
+        stop_requested = self.stop_event.is_set  # Bound once; checked per build
         
         self._log("\n📈 Using Progressive Evolution (Curriculum Learning)")
         self._log("   Starting with limited points, finding what works, then scaling up")
@@ -1881,10 +2473,10 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         # Progressive tiers - what % of points to use at each tier
         tiers = [0.05, 0.10, 0.20, 0.40, 0.70, 1.0]  # 5%, 10%, 20%, 40%, 70%, 100%
         
-        num_sims = self.num_sims_per_build.get()
-        num_procs = self.num_processes.get()
-        use_rust = self.use_rust.get() and RUST_AVAILABLE
-        pop_size = self.evo_population.get()
+        num_sims = settings.num_sims
+        num_procs = settings.num_procs
+        use_rust = settings.use_rust
+        pop_size = settings.population_size
         builds_per_tier = pop_size  # How many builds to test per tier
         
         total_builds_planned = len(tiers) * builds_per_tier
@@ -1896,12 +2488,19 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
             self._log(f"   🦀 Using Rust engine")
         else:
             self._log(f"   🐍 Using Python engine with {num_procs} processes")
+        # Every build in the run shares base_config, so the Rust engine parses it once
+        rust_session = self._open_rust_session(hunter_class, base_config) if use_rust else None
         
         total_tested = 0
         elite_patterns = []  # Patterns that worked well from previous tier
+        elite_cum_weights = []  # Running avg_stage totals, so stronger elites are extended more often
+        previous_tier_results = {}  # Build hash -> result, for builds carried over unchanged
+        # Fixed per-hunter orders: attribute costs for the spend check, talent names for build hashes
+        attr_costs = {attr: info["cost"] for attr, info in hunter_class.costs["attributes"].items()}
+        talent_names = tuple(hunter_class.costs["talents"])
         
         for tier_idx, tier_pct in enumerate(tiers):
-            if self.stop_event.is_set():
+            if stop_requested():
                 self._log('\n⏹️ Optimization stopped by user.')
                 break
             
@@ -1909,6 +2508,9 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
             tier_talent_points = max(1, int(level * tier_pct))
             tier_attr_points = max(3, int(level * 3 * tier_pct))
             tier_level = max(1, int(level * tier_pct))  # Effective level for this tier
+            # Builds spending less than 95% of either budget are rejected
+            min_talent_spent = tier_talent_points * 0.95
+            min_attr_spent = tier_attr_points * 0.95
             
             self._log(f"\n{'='*60}")
             self._log(f"📊 TIER {tier_idx + 1}/{len(tiers)}: {int(tier_pct*100)}% points (Level ~{tier_level})")
@@ -1925,25 +2527,27 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
             
             tier_results = []
             tier_builds = []
+            tier_results_by_hash = {}
+            tier_pending = []  # (build hash, talents, attributes, config) for each build to simulate
             tested_hashes = set()  # Track unique builds in this tier
             consecutive_dupes = 0  # Track consecutive duplicate attempts
             max_consecutive_dupes = 100  # Stop tier if we can't find new builds
             
             for i in range(builds_per_tier):
-                if self.stop_event.is_set():
+                if stop_requested():
                     break
                 
                 # Check if we've exhausted unique builds for this tier
                 if consecutive_dupes >= max_consecutive_dupes:
-                    self._log(f"   ⚡ Tier exhausted after {len(tier_results)} unique builds (no new builds found)")
+                    self._log(f"   ⚡ Tier exhausted after {len(tier_pending)} unique builds (no new builds found)")
                     break
                 
                 # Generate a build - if we have elite patterns, bias towards them
                 talents, attrs = None, None
                 if elite_patterns and random.random() < 0.7:  # 70% chance to build from elite
                     # Pick an elite pattern and extend it (always succeeds)
-                    elite = random.choice(elite_patterns)
-                    talents, attrs = self._extend_elite_pattern(
+                    elite = random.choices(elite_patterns, cum_weights=elite_cum_weights)[0]
+                    talents, attrs, talent_spent, attr_spent = self._extend_elite_pattern(
                         elite, tier_generator, tier_talent_points, tier_attr_points
                     )
                 else:
@@ -1951,42 +2555,60 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
                     builds = tier_generator.generate_smart_sample(sample_size=1)
                     if builds:
                         talents, attrs = builds[0]
+                        talent_spent = sum(talents.values())
+                        attr_spent = sum(attr_costs[a] * lvl for a, lvl in attrs.items())
                     else:
                         consecutive_dupes += 1
                         continue
                 
-                # Check if this build is a duplicate
-                build_hash = (tuple(sorted(talents.items())), tuple(sorted(attrs.items())))
-                if build_hash in tested_hashes:
+                # VALIDATION: Ensure build uses correct number of points (checked before the
+                # duplicate test since it is cheaper, and a rejected build is a dupe either way)
+                if talent_spent < min_talent_spent or attr_spent < min_attr_spent:
+                    # Build is significantly under-spent - skip it and try again
                     consecutive_dupes += 1
                     continue
-                tested_hashes.add(build_hash)
-                consecutive_dupes = 0  # Reset counter on successful unique build
-                
-                # VALIDATION: Ensure build uses correct number of points
-                talent_spent = sum(talents.values())
-                attr_costs_local = {a: tier_generator.costs["attributes"][a]["cost"] for a in attrs}
-                attr_spent = sum(attrs[a] * attr_costs_local[a] for a in attrs)
                 
-                if talent_spent < tier_talent_points * 0.95 or attr_spent < tier_attr_points * 0.95:
-                    # Build is significantly under-spent - skip it and try again
+                # Check if this build is a duplicate; levels are read in the hunter's fixed
+                # talent/attribute order, so the key needs no per-build sort
+                build_hash = (*[talents.get(t, 0) for t in talent_names],
+                              *[attrs.get(a, 0) for a in attr_costs])
+                if build_hash in tested_hashes:
                     consecutive_dupes += 1
                     continue
+                tested_hashes.add(build_hash)
+                consecutive_dupes = 0  # Reset counter on successful unique build
                 
                 # Create config for this build
-                config = copy.deepcopy(base_config)
-                config["talents"] = talents
-                config["attributes"] = attrs
+                config = {**base_config, "talents": talents, "attributes": attrs}
+                tier_pending.append((build_hash, talents, attrs, config))
+            
+            # A tier's builds don't depend on each other's results, so they are all generated
+            # first and then simulated; the Rust engine takes them a block per simulate_batch call
+            rust_results = []
+            for i, (build_hash, talents, attrs, config) in enumerate(tier_pending):
+                if stop_requested():
+                    break
                 
                 try:
-                    # Run simulations
-                    if use_rust:
-                        result = self._simulate_build_rust(hunter_class, config, num_sims)
-                    else:
-                        result = self._simulate_build(hunter_class, config, num_sims, num_procs)
+                    # An elite the tier had no points to extend is the same build as last tier,
+                    # so its result is reused rather than simulated (and reported) again
+                    result = previous_tier_results.get(build_hash)
+                    if result is None:
+                        if use_rust:
+                            if not rust_results:
+                                block = [pending[3] for pending in tier_pending[i:i + RUST_BATCH_SIZE]
+                                         if pending[0] not in previous_tier_results]
+                                rust_results = self._simulate_builds_batch(hunter_class, block, num_sims, True,
+                                                                           session=rust_session)
+                                rust_results.reverse()
+                            result = rust_results.pop()
+                        else:
+                            result = self._simulate_build(hunter_class, config, num_sims, num_procs)
+                        if result:
+                            self._record_result(result)
                     
                     if result:
-                        self.results.append(result)
+                        tier_results_by_hash[build_hash] = result
                         tier_results.append({
                             'avg_stage': result.avg_final_stage,
                             'max_stage': result.highest_stage,
@@ -1999,7 +2621,7 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
                 
                 total_tested += 1
                 progress = min(100, (total_tested / total_builds_planned) * 100)
-                self.result_queue.put(('progress', progress, total_tested, total_builds_planned))
+                self._post_progress(progress, total_tested, total_builds_planned)
                 
                 # Log progress every 20% of tier
                 if (i + 1) % max(1, builds_per_tier // 5) == 0:
@@ -2026,7 +2648,6 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
                 # Select elite patterns for next tier
                 # Promote at least 100 patterns (or 10% of tested, whichever is greater)
                 # If fewer than 100 builds exist, promote ALL of them
-                tier_results.sort(key=lambda x: x['avg_stage'], reverse=True)
                 min_elites = 100
                 pct_elites = len(tier_results) // 10  # 10%
                 if len(tier_results) <= min_elites:
@@ -2035,11 +2656,16 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
                 else:
                     # Larger tier - promote at least 100 or 10%, whichever is greater
                     elite_count = max(min_elites, pct_elites)
+                # Only the elites need ordering, not the whole tier
+                elites = heapq.nlargest(elite_count, tier_results, key=itemgetter('avg_stage'))
                 elite_patterns = [
                     {'talents': r['talents'], 'attributes': r['attributes']}
-                    for r in tier_results[:elite_count]
+                    for r in elites
                 ]
+                # +1 keeps builds that died at stage 0 selectable
+                elite_cum_weights = list(itertools.accumulate(r['avg_stage'] + 1 for r in elites))
                 self._log(f"   Promoted {len(elite_patterns)} elite patterns to next tier")
+            previous_tier_results = tier_results_by_hash
         
         # Final summary
         total_time = time.time() - self.optimization_start_time
@@ -2049,130 +2675,120 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         self._log(f"✅ Progressive evolution complete!")
         self._log(f"   Tested {total_tested:,} builds across {len(tiers)} tiers")
         self._log(f"   Time: {total_time:.1f}s ({rate:.1f} builds/sec)")
-        self._log(f"   Found {len(self.results):,} valid builds")
+        self._log(f"   Found {self.valid_build_count:,} valid builds")
         
         self.result_queue.put(('done', None, None, None))
     
     def _extend_elite_pattern(self, elite: Dict, generator: BuildGenerator,
-                              target_talents: int, target_attrs: int) -> Tuple[Dict, Dict]:
+                              target_talents: int, target_attrs: int) -> Tuple[Dict, Dict, int, int]:
         """Extend an elite pattern with more points using random walk.
         
         Takes a successful build from a previous tier and adds more points
         using random walk to explore extensions of what worked.
         
         ALWAYS succeeds - uses unlimited attributes to sink any remaining points.
+        Returns (talents, attributes, talent points spent, attribute points spent),
+        the totals being tracked during the walk so callers need not re-sum them.
         """
         import random
         
-        # Start with the elite's allocation - ensure all talents/attrs are initialized
-        talents_list = list(generator.costs["talents"].keys())
-        attrs_list = list(generator.costs["attributes"].keys())
+        # Cost tables, compiled attribute rules and index tables are the generator's, built once per tier
+        talents_list, attrs_list, _, _, _, attr_rules, walk_index = generator._get_walk_tables()
+        talent_caps, known_talents, unknown_talent, unlimited = walk_index
+        costs, attr_gates, unlock_checks, _, affected, _, _ = attr_rules
         
-        talents = {t: elite.get('talents', {}).get(t, 0) for t in talents_list}
-        attrs = {a: elite.get('attributes', {}).get(a, 0) for a in attrs_list}
+        # Start with the elite's allocation, as levels by talent/attribute index
+        elite_talents = elite.get('talents', {})
+        elite_attrs = elite.get('attributes', {})
+        talent_levels = [elite_talents.get(t, 0) for t in talents_list]
+        levels = [elite_attrs.get(a, 0) for a in attrs_list]
         
         # Calculate how many points elite used
-        elite_talent_spent = sum(talents.values())
-        elite_attr_spent = sum(
-            attrs[a] * generator.costs["attributes"][a]["cost"]
-            for a in attrs_list
-        )
+        elite_talent_spent = sum(talent_levels)
+        elite_attr_spent = sum(level * cost for level, cost in zip(levels, costs))
         
         # Points we need to add
         talent_to_add = target_talents - elite_talent_spent
         attr_to_add = target_attrs - elite_attr_spent
         
-        # Find unlimited attributes (our fallback sinks)
-        attr_costs = {a: generator.costs["attributes"][a]["cost"] for a in attrs_list}
-        attr_max = {a: generator.costs["attributes"][a]["max"] for a in attrs_list}
-        unlimited_attrs = [a for a in attrs_list if attr_max[a] == float('inf')]
-        
-        # Extend talents using random walk
-        talent_max = {t: generator.costs["talents"][t]["max"] for t in talents_list}
+        # Extend talents using random walk. KNOWN talents that can accept more points
+        # (exclude unknown_talent) are found once, and dropped as they max out.
+        valid = [i for i in known_talents if talent_caps[i] is None or talent_levels[i] < talent_caps[i]]
         
         while talent_to_add > 0:
-            # Find KNOWN talents that can accept more points (exclude unknown_talent)
-            valid = [t for t in talents_list 
-                     if t != 'unknown_talent' and (talent_max[t] == float('inf') or talents[t] < int(talent_max[t]))]
-            
             # Only use unknown_talent as LAST RESORT when all known talents are maxed
             if not valid:
-                if 'unknown_talent' in talents_list:
-                    valid = ['unknown_talent']
-                else:
-                    break  # All talents maxed
+                if unknown_talent is not None:
+                    talent_levels[unknown_talent] += talent_to_add
+                    talent_to_add = 0
+                break  # Otherwise all talents maxed
             
             chosen = random.choice(valid)
-            talents[chosen] += 1
+            talent_levels[chosen] += 1
             talent_to_add -= 1
+            if talent_caps[chosen] is not None and talent_levels[chosen] >= talent_caps[chosen]:
+                valid.remove(chosen)
+        talents = dict(zip(talents_list, talent_levels))
         
-        # Extend attributes using random walk
-        deps = getattr(generator.hunter_class, 'attribute_dependencies', {})
-        exclusions = getattr(generator.hunter_class, 'attribute_exclusions', [])
+        # Extend attributes using random walk. Each attribute's cap, dependency and exclusion
+        # check is the generator's compiled unlock check, only re-run when a related level changes.
+        # Unlimited attributes are our fallback sinks.
+        n = len(attrs_list)
+        unlocked = [check(levels) for check in unlock_checks]
         
         remaining = attr_to_add
+        spent = elite_attr_spent  # Running total for the point gate checks
+        # Points spent in OTHER attributes only grow, so a gate stays open once it opens.
+        # The valid list is then reused until an unlock changes, a gate may still open,
+        # or the remaining points may no longer cover some attribute's cost.
+        gate_open = [gate is None for gate in attr_gates]
+        gates_pending = not all(gate_open)
+        max_cost = max(costs, default=0)
+        valid_attrs = None
         
         while remaining > 0:
-            valid_attrs = []
-            for attr in attrs_list:
-                cost = attr_costs[attr]
-                if cost > remaining:
-                    continue
-                # Unlimited attributes can always accept more
-                if attr_max[attr] != float('inf'):
-                    max_lvl = int(attr_max[attr])
-                    if attrs[attr] >= max_lvl:
-                        continue
-                # Check dependencies
-                if attr in deps:
-                    if not all(attrs.get(req, 0) >= lvl for req, lvl in deps[attr].items()):
-                        continue
-                # Check point gates
-                if not generator._can_unlock_attribute(attr, attrs, attr_costs):
-                    continue
-                # Check exclusions
-                excluded = False
-                for excl_pair in exclusions:
-                    if attr in excl_pair:
-                        other = excl_pair[0] if excl_pair[1] == attr else excl_pair[1]
-                        if attrs.get(other, 0) > 0:
-                            excluded = True
-                            break
-                if excluded:
-                    continue
-                valid_attrs.append(attr)
+            if valid_attrs is None or gates_pending or remaining < max_cost:
+                for i in range(n):
+                    if not gate_open[i] and spent - levels[i] * costs[i] >= attr_gates[i]:
+                        gate_open[i] = True
+                gates_pending = not all(gate_open)
+                valid_attrs = [i for i in range(n)
+                               if unlocked[i] and costs[i] <= remaining and gate_open[i]]
             
             if valid_attrs:
                 chosen = random.choice(valid_attrs)
-                attrs[chosen] += 1
-                remaining -= attr_costs[chosen]
-            elif unlimited_attrs:
-                # FALLBACK: Dump into first unlimited attribute that we can afford
-                for sink_attr in unlimited_attrs:
-                    if attr_costs[sink_attr] <= remaining:
-                        attrs[sink_attr] += 1
-                        remaining -= attr_costs[sink_attr]
-                        break
-                else:
-                    # Can't afford any unlimited attr (remaining < min cost)
-                    break
             else:
-                # No valid attrs and no unlimited - shouldn't happen, but break to avoid infinite loop
-                break
-        
-        return talents, attrs
+                # FALLBACK: Dump into first unlimited attribute that we can afford
+                chosen = next((i for i in unlimited if costs[i] <= remaining), None)
+                if chosen is None:
+                    break  # Can't afford any unlimited attr (or there are none)
+            levels[chosen] += 1
+            remaining -= costs[chosen]
+            spent += costs[chosen]
+            for i in affected[chosen]:
+                now_unlocked = unlock_checks[i](levels)
+                if now_unlocked != unlocked[i]:
+                    unlocked[i] = now_unlocked
+                    valid_attrs = None
+        
+        attrs = dict(zip(attrs_list, levels))
+        return talents, attrs, target_talents - talent_to_add, spent
     
-    def _run_sampling_optimization(self, hunter_class, level: int, base_config: Dict):
+    def _run_sampling_optimization(self, hunter_class, level: int, base_config: Dict,
+                                   settings: RunSettings):
         """Run traditional random sampling optimization."""
-        import copy
+        stop_requested = self.stop_event.is_set  # Bound once; checked per build
         
         # Generate combinations
         self._log("\n📊 Generating build combinations...")
         generator = BuildGenerator(hunter_class, level)
-        max_builds = self.max_builds_to_test.get()
+        max_builds = settings.max_builds
         
-        # First, try to estimate the total number of combinations
-        talent_combos = generator.get_talent_combinations()
+        # First, try to estimate the total number of combinations.
+        # Combos stay as level tuples; only the builds actually tested become dicts
+        talent_names = list(generator.costs["talents"])
+        attr_names = list(generator.costs["attributes"])
+        talent_combos = generator.get_talent_combinations(as_dicts=False)
         self._log(f"   Found {len(talent_combos)} talent combinations")
         
         # For attributes, we need to be careful with high-level characters
@@ -2185,7 +2801,7 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
             total_combos = f"~{max_builds:,}+ (smart sampled)"
         else:
             # For lower levels, we can enumerate all combinations
-            attr_combos = generator.get_attribute_combinations(max_per_infinite=20)
+            attr_combos = generator.get_attribute_combinations(max_per_infinite=20, as_dicts=False)
             self._log(f"   Found {len(attr_combos)} attribute combinations")
             
             total_combos_num = len(talent_combos) * len(attr_combos)
@@ -2196,15 +2812,23 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
             if total_combos_num > max_builds:
                 self._log(f"⚠️ Sampling {max_builds:,} random builds from {total_combos_num:,} possibilities")
                 import random
-                all_combos = list(itertools.product(talent_combos, attr_combos))
-                random.shuffle(all_combos)
-                build_combos = all_combos[:max_builds]
+                # Sample flat indices into the talent x attribute grid instead of
+                # materializing the whole cross product just to keep a slice of it
+                num_attr_combos = len(attr_combos)
+                build_combos = [
+                    (dict(zip(talent_names, talent_combos[i // num_attr_combos])),
+                     dict(zip(attr_names, attr_combos[i % num_attr_combos])))
+                    for i in random.sample(range(total_combos_num), max_builds)
+                ]
             else:
-                build_combos = list(itertools.product(talent_combos, attr_combos))
+                build_combos = [
+                    (dict(zip(talent_names, talents)), dict(zip(attr_names, attrs)))
+                    for talents, attrs in itertools.product(talent_combos, attr_combos)
+                ]
         
-        num_sims = self.num_sims_per_build.get()
-        num_procs = self.num_processes.get()
-        use_rust = self.use_rust.get() and RUST_AVAILABLE
+        num_sims = settings.num_sims
+        num_procs = settings.num_procs
+        use_rust = settings.use_rust
         
         self._log(f"\n🔄 Testing {len(build_combos):,} builds with {num_sims} simulations each...")
         if use_rust:
@@ -2214,54 +2838,160 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         self._log("")
         
         tested = 0
-        for i, (talents, attributes) in enumerate(build_combos):
-            if self.stop_event.is_set():
-                self.result_queue.put(('log', '\n⏹️ Optimization stopped by user.', None, None))
-                break
-            
-            # Create config for this build
-            config = copy.deepcopy(base_config)
-            config["talents"] = talents
-            config["attributes"] = attributes
-            
-            try:
-                # Run simulations for this build
-                if use_rust:
-                    result = self._simulate_build_rust(hunter_class, config, num_sims)
-                else:
-                    result = self._simulate_build(hunter_class, config, num_sims, num_procs)
-                if result:
-                    self.results.append(result)
-            except Exception as e:
-                # Skip invalid builds
-                pass
-            
-            tested += 1
-            progress = (tested / len(build_combos)) * 100
-            self.result_queue.put(('progress', progress, tested, len(build_combos)))
-            
-            # Log every 1% or every 100 builds, whichever is less frequent
-            log_interval = max(100, len(build_combos) // 100)
-            if tested % log_interval == 0:
-                elapsed = time.time() - self.optimization_start_time
-                rate = tested / elapsed if elapsed > 0 else 0
-                self.result_queue.put(('log', f"   {tested:,}/{len(build_combos):,} builds ({progress:.1f}%) - {rate:.1f} builds/sec", None, None))
+        # Rust engine: builds go a block per simulate_batch call, run concurrently by the engine
+        rust_session = self._open_rust_session(hunter_class, base_config) if use_rust else None
+        rust_results = []
+        # Python engine: stream every build through one pool, a build per task, so workers
+        # move straight on to the next build instead of waiting on each build's slowest sim
+        executor = None
+        pool_results = None
+        if not use_rust and num_procs > 1:
+            executor = ProcessPoolExecutor(max_workers=num_procs, initializer=_init_build_worker,
+                                           initargs=(hunter_class, base_config, num_sims))
+            # Small chunks keep progress and stop checks responsive on long runs
+            chunksize = max(1, min(SAMPLING_POOL_CHUNK, len(build_combos) // (num_procs * 4)))
+            pool_results = executor.map(
+                _simulate_build_worker,
+                [(tuple(t.items()), tuple(a.items())) for t, a in build_combos],
+                chunksize=chunksize)
+        
+        try:
+            for i, (talents, attributes) in enumerate(build_combos):
+                if stop_requested():
+                    self.result_queue.put(('log', '\n⏹️ Optimization stopped by user.', None, None))
+                    break
+                
+                # Create config for this build
+                config = {**base_config, "talents": talents, "attributes": attributes}
+                
+                try:
+                    # Run simulations for this build
+                    if use_rust:
+                        if not rust_results:
+                            block = [{**base_config, "talents": t, "attributes": a}
+                                     for t, a in build_combos[i:i + RUST_BATCH_SIZE]]
+                            rust_results = self._simulate_builds_batch(hunter_class, block, num_sims, True,
+                                                                       session=rust_session)
+                            rust_results.reverse()
+                        result = rust_results.pop()
+                    elif pool_results is not None:
+                        results_list = next(pool_results)
+                        result = self._aggregate_results(config, results_list) if results_list else None
+                    else:
+                        result = self._simulate_build(hunter_class, config, num_sims, num_procs)
+                    if result:
+                        self._record_result(result)
+                except Exception as e:
+                    # Skip invalid builds
+                    pass
+                
+                tested += 1
+                progress = (tested / len(build_combos)) * 100
+                self._post_progress(progress, tested, len(build_combos))
+                
+                # Log every 1% or every 100 builds, whichever is less frequent
+                log_interval = max(100, len(build_combos) // 100)
+                if tested % log_interval == 0:
+                    elapsed = time.time() - self.optimization_start_time
+                    rate = tested / elapsed if elapsed > 0 else 0
+                    self.result_queue.put(('log', f"   {tested:,}/{len(build_combos):,} builds ({progress:.1f}%) - {rate:.1f} builds/sec", None, None))
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
         
         # Final summary
         total_time = time.time() - self.optimization_start_time
         rate = tested / total_time if total_time > 0 else 0
         self._log(f"\n✅ Optimization complete!")
         self._log(f"   Tested {tested:,} builds in {total_time:.1f}s ({rate:.1f} builds/sec)")
-        self._log(f"   Found {len(self.results):,} valid builds")
+        self._log(f"   Found {self.valid_build_count:,} valid builds")
         self.result_queue.put(('done', None, None, None))
     
+    def _memo_get(self, key: str):
+        """Return a recently simulated result for a sim cache key, if still held."""
+        with self._result_memo_lock:
+            result = self._result_memo.get(key)
+            if result is not None:
+                self._result_memo.move_to_end(key)
+            return result
+    
+    def _memo_put(self, key: str, result: BuildResult):
+        """Remember a result, evicting the least recently used past SIM_MEMO_SIZE."""
+        with self._result_memo_lock:
+            self._result_memo[key] = result
+            self._result_memo.move_to_end(key)
+            if len(self._result_memo) > SIM_MEMO_SIZE:
+                self._result_memo.popitem(last=False)
+    
+    def _simulate_builds_batch(self, hunter_class, configs: List[Dict], num_sims: int,
+                               use_rust: bool, num_procs: int = 1,
+                               keys: List[str] = None, session=None) -> List[BuildResult]:
+        """Simulate several builds at once, in order, reusing remembered results.
+        
+        On the Rust engine every config not already in the memo goes through a
+        single simulate_batch call instead of one FFI round trip per build. The
+        Python engine simulates one config per worker when num_procs > 1.
+        Pass `keys` when the caller already has each config's cache key, and a Rust
+        `session` from _open_rust_session when every config is its base config with
+        other talents/attributes; then only those are sent to the engine.
+        """
+        if keys is None:
+            engine = "rust" if use_rust else "python"
+            keys = [_sim_cache_key(hunter_class, config, num_sims, engine) for config in configs]
+        results = [self._memo_get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return results
+        
+        batch = None
+        if use_rust and RUST_AVAILABLE:
+            try:
+                if session is not None:
+                    builds = [(configs[i].get("talents", {}), configs[i].get("attributes", {})) for i in missing]
+                    if hasattr(session, "simulate_batch_json"):
+                        # Whole batch as one JSON array: a single parse per call
+                        stats_list = json.loads(session.simulate_batch_json(builds, num_sims, True))
+                    else:
+                        stats_list = map(json.loads, session.simulate_batch(builds, num_sims, True))
+                else:
+                    payload = [_rust_config_json(hunter_class, configs[i]) for i in missing]
+                    stats_list = map(json.loads, rust_sim.simulate_batch(payload, num_sims, True))
+                batch = [self._rust_stats_to_result(configs[i], stats)
+                         for i, stats in zip(missing, stats_list)]
+            except Exception as e:
+                print(f"Rust batch simulation failed: {e}, falling back to Python")
+        if batch is None and num_procs > 1 and len(missing) > 1:
+            with ProcessPoolExecutor(max_workers=min(num_procs, len(missing))) as executor:
+                raw = executor.map(_simulate_config_worker, [hunter_class] * len(missing),
+                                   [configs[i] for i in missing], [num_sims] * len(missing))
+                batch = [self._aggregate_results(configs[i], results_list) if results_list else None
+                         for i, results_list in zip(missing, raw)]
+        if batch is None:
+            batch = [self._simulate_build_sequential(hunter_class, configs[i], num_sims) for i in missing]
+        
+        for i, result in zip(missing, batch):
+            results[i] = result
+            if result:
+                self._memo_put(keys[i], result)
+        return results
+    
+    def _open_rust_session(self, hunter_class, base_config: Dict):
+        """Parse a run's base config into the Rust engine once, for _simulate_builds_batch.
+        
+        Returns None when the installed engine predates SimSession, so callers
+        fall back to sending full configs.
+        """
+        if not RUST_AVAILABLE or not hasattr(rust_sim, "SimSession"):
+            return None
+        try:
+            return rust_sim.SimSession(_rust_config_json(hunter_class, base_config))
+        except Exception as e:
+            print(f"Rust session failed: {e}, sending full configs")
+            return None
+    
     def _simulate_build_sequential(self, hunter_class, config: Dict, num_sims: int) -> BuildResult:
         """Run simulations sequentially (low memory usage, for advisor)."""
-        results_list = []
-        
-        for _ in range(num_sims):
-            sim = Simulation(hunter_class(config))
-            results_list.append(sim.run())
+        results_list = _pack_sim_results(Simulation(hunter_class(config)).run() for _ in range(num_sims))
         
         if not results_list:
             return None
@@ -2269,98 +2999,58 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         return self._aggregate_results(config, results_list)
     
     def _simulate_build(self, hunter_class, config: Dict, num_sims: int, num_procs: int) -> BuildResult:
-        """Run simulations for a single build and return results."""
-        results_list = []
+        """Run simulations for a single build and return results.
         
+        With num_procs > 1 the sims run on a worker pool started on the first call and
+        shared by the rest of the run; _run_optimization shuts it down. Workers get the
+        hunter class once, and sims are sent in one chunk per worker, so the config is
+        pickled once per worker rather than once per sim.
+        """
         if num_procs > 1:
-            with ProcessPoolExecutor(max_workers=num_procs) as executor:
-                results_list = list(executor.map(
-                    sim_worker, 
-                    [hunter_class] * num_sims, 
-                    [config] * num_sims
-                ))
+            if self._sim_pool is None:
+                self._sim_pool = ProcessPoolExecutor(max_workers=num_procs, initializer=_init_sim_worker,
+                                                     initargs=(hunter_class,))
+            results_list = array('d', itertools.chain.from_iterable(self._sim_pool.map(
+                _sim_worker, [config] * num_sims, chunksize=-(-num_sims // num_procs))))
         else:
-            for _ in range(num_sims):
-                sim = Simulation(hunter_class(config))
-                results_list.append(sim.run())
+            results_list = _pack_sim_results(Simulation(hunter_class(config)).run() for _ in range(num_sims))
         
         if not results_list:
             return None
         
         return self._aggregate_results(config, results_list)
     
-    def _simulate_build_rust(self, hunter_class, config: Dict, num_sims: int) -> BuildResult:
-        """Run simulations using the high-performance Rust engine."""
-        if not RUST_AVAILABLE:
-            # Fall back to Python
-            return self._simulate_build_sequential(hunter_class, config, num_sims)
-        
-        # Determine hunter type
-        if hunter_class == Borge:
-            hunter_type = "Borge"
-        elif hunter_class == Ozzy:
-            hunter_type = "Ozzy"
-        elif hunter_class == Knox:
-            hunter_type = "Knox"
-        else:
-            hunter_type = "Borge"
-        
-        try:
-            # Get level from the correct location in config
-            level = config.get("meta", {}).get("level", 100)
-            
-            result = rust_sim.simulate(
-                hunter=hunter_type,
-                level=level,
-                stats=config.get("stats", {}),
-                talents=config.get("talents", {}),
-                attributes=config.get("attributes", {}),
-                inscryptions=config.get("inscryptions", {}),
-                mods=config.get("mods", {}),
-                relics=config.get("relics", {}),
-                gems=config.get("gems", {}),
-                num_sims=num_sims,
-                parallel=True
-            )
-            
-            # Convert Rust result to BuildResult
-            stats = result.get("stats", {})
-            return BuildResult(
-                talents=config.get("talents", {}).copy(),
-                attributes=config.get("attributes", {}).copy(),
-                avg_final_stage=stats.get("avg_stage", 0),
-                highest_stage=stats.get("max_stage", 0),
-                lowest_stage=stats.get("min_stage", 0),
-                avg_loot_per_hour=stats.get("avg_loot_per_hour", 0),
-                avg_damage=stats.get("avg_damage", 0),
-                avg_kills=stats.get("avg_kills", 0),
-                avg_elapsed_time=stats.get("avg_time", 0),
-                avg_damage_taken=stats.get("avg_damage_taken", 0),
-                survival_rate=stats.get("survival_rate", 0),
-                boss1_survival=stats.get("boss1_survival", 0),
-                boss2_survival=stats.get("boss2_survival", 0),
-                boss3_survival=stats.get("boss3_survival", 0),
-                boss4_survival=stats.get("boss4_survival", 0),
-                boss5_survival=stats.get("boss5_survival", 0),
-                config=config,
-            )
-        except Exception as e:
-            # Fall back to Python on error
-            print(f"Rust simulation failed: {e}, falling back to Python")
-            return self._simulate_build_sequential(hunter_class, config, num_sims)
-    
-    def _aggregate_results(self, config: Dict, results_list: List) -> BuildResult:
-        """Aggregate simulation results into a BuildResult."""
-        final_stages = [r['final_stage'] for r in results_list]
-        elapsed_times = [r['elapsed_time'] for r in results_list]
-        damages = [r['damage'] for r in results_list]
-        kills = [r['kills'] for r in results_list]
-        damage_takens = [r['damage_taken'] for r in results_list]
-        loots = [r['total_loot'] for r in results_list]
+    def _rust_stats_to_result(self, config: Dict, stats: Dict) -> BuildResult:
+        """Wrap the Rust engine's aggregated stats for one build in a BuildResult."""
+        return BuildResult(
+            talents=config.get("talents", {}).copy(),
+            attributes=config.get("attributes", {}).copy(),
+            avg_final_stage=stats.get("avg_stage", 0),
+            highest_stage=stats.get("max_stage", 0),
+            lowest_stage=stats.get("min_stage", 0),
+            avg_loot_per_hour=stats.get("avg_loot_per_hour", 0),
+            avg_damage=stats.get("avg_damage", 0),
+            avg_kills=stats.get("avg_kills", 0),
+            avg_elapsed_time=stats.get("avg_time", 0),
+            avg_damage_taken=stats.get("avg_damage_taken", 0),
+            survival_rate=stats.get("survival_rate", 0),
+            boss1_survival=stats.get("boss1_survival", 0),
+            boss2_survival=stats.get("boss2_survival", 0),
+            boss3_survival=stats.get("boss3_survival", 0),
+            boss4_survival=stats.get("boss4_survival", 0),
+            boss5_survival=stats.get("boss5_survival", 0),
+            config=config,
+        )
+    
+    def _aggregate_results(self, config: Dict, results_list: array) -> BuildResult:
+        """Aggregate simulation results, packed by _pack_sim_results, into a BuildResult."""
+        # Each field is a strided slice of the packed sims, in SIM_RESULT_FIELDS order
+        final_stages, elapsed_times, damages, kills, damage_takens, loots = (
+            results_list[i::len(SIM_RESULT_FIELDS)] for i in range(len(SIM_RESULT_FIELDS)))
         
         # Calculate loot per hour
-        loot_per_hours = [(loots[i] / (elapsed_times[i] / 3600)) if elapsed_times[i] > 0 else 0 
-                          for i in range(len(loots))]
+        loot_per_hours = [(loot / (elapsed / 3600)) if elapsed > 0 else 0
+                          for loot, elapsed in zip(loots, elapsed_times)]
         
         # Calculate legacy survival rate (didn't die at a boss stage ending in 00)
         boss_deaths = sum(1 for s in final_stages if s % 100 == 0 and s > 0)
@@ -2377,14 +3067,14 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         return BuildResult(
             talents=config["talents"].copy(),
             attributes=config["attributes"].copy(),
-            avg_final_stage=statistics.mean(final_stages),
-            highest_stage=max(final_stages),
-            lowest_stage=min(final_stages),
-            avg_loot_per_hour=statistics.mean(loot_per_hours),
-            avg_damage=statistics.mean(damages),
-            avg_kills=statistics.mean(kills),
-            avg_elapsed_time=statistics.mean(elapsed_times),
-            avg_damage_taken=statistics.mean(damage_takens),
+            avg_final_stage=_mean(final_stages),
+            highest_stage=int(max(final_stages)),
+            lowest_stage=int(min(final_stages)),
+            avg_loot_per_hour=_mean(loot_per_hours),
+            avg_damage=_mean(damages),
+            avg_kills=_mean(kills),
+            avg_elapsed_time=_mean(elapsed_times),
+            avg_damage_taken=_mean(damage_takens),
             survival_rate=survival_rate,
             boss1_survival=boss1_survival,
             boss2_survival=boss2_survival,
@@ -2394,31 +3084,51 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
             config=config,
         )
     
+    def _record_result(self, result: BuildResult):
+        """Keep a valid build, pruning self.results once it reaches RESULTS_PRUNE_THRESHOLD.
+        
+        Only the top RESULTS_KEEP_PER_RANKING builds of each ranking survive a prune,
+        in their original order, so every top-N the results read stays the same
+        while memory stays flat however many builds a run tests.
+        """
+        self.valid_build_count += 1
+        self.results.append(result)
+        if len(self.results) < RESULTS_PRUNE_THRESHOLD:
+            return
+        keep = set()
+        for attr, highest_first in RESULT_RANKINGS:
+            pick = heapq.nlargest if highest_first else heapq.nsmallest
+            keep.update(map(id, pick(RESULTS_KEEP_PER_RANKING, self.results, key=attrgetter(attr))))
+        self.results = [r for r in self.results if id(r) in keep]
+    
+    def _post_progress(self, progress: float, tested: int, total: int):
+        """Queue a progress update, at most once per PROGRESS_POST_INTERVAL.
+        
+        The poller only shows the latest update it drains, so posting more often
+        would just add queue traffic from the optimizer thread.
+        """
+        now = time.monotonic()
+        if now - self._last_progress_post >= PROGRESS_POST_INTERVAL:
+            self._last_progress_post = now
+            self.result_queue.put(('progress', progress, tested, total))
+    
     def _poll_results(self):
-        """Poll for results from the background thread."""
+        """Poll for results from the background thread.
+        
+        Up to POLL_MAX_MESSAGES queued messages are drained at once: log lines are
+        written with a single insert and only the latest progress update is shown.
+        If more are waiting, the next poll comes straight after Tk handles its events.
+        """
+        log_lines = []
+        progress = None
+        finished = False
+        backlog = True  # Still set after the loop if POLL_MAX_MESSAGES were handled without emptying the queue
         try:
-            while True:
+            for _ in range(POLL_MAX_MESSAGES):
                 msg_type, data, tested, total = self.result_queue.get_nowait()
                 
                 if msg_type == 'progress':
-                    self.progress_var.set(data)
-                    # Calculate ETA
-                    elapsed = time.time() - self.optimization_start_time
-                    if tested > 0:
-                        builds_per_sec = tested / elapsed
-                        remaining = total - tested
-                        eta_seconds = remaining / builds_per_sec if builds_per_sec > 0 else 0
-                        if eta_seconds < 60:
-                            eta_str = f"{eta_seconds:.0f}s"
-                        elif eta_seconds < 3600:
-                            eta_str = f"{eta_seconds/60:.1f}m"
-                        else:
-                            eta_str = f"{eta_seconds/3600:.1f}h"
-                        self.status_label.configure(
-                            text=f"Testing build {tested:,}/{total:,} | {builds_per_sec:.1f} builds/sec | ETA: {eta_str}"
-                        )
-                    else:
-                        self.status_label.configure(text=f"Testing build {tested}/{total}...")
+                    progress = (data, tested, total)
                 elif msg_type == 'best_update':
                     # data is dict with best_max, best_avg, gen
                     if data.get('best_max', 0) > self.best_max_stage:
@@ -2430,19 +3140,44 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
                         self.best_avg_gen = data.get('gen', 0)
                         self.best_avg_label.configure(text=f"📊 Best Avg: {self.best_avg_stage:.1f} (Gen {self.best_avg_gen})")
                 elif msg_type == 'log':
-                    self._log(data)
-                elif msg_type == 'done':
-                    self._optimization_complete()
-                    return
-                elif msg_type == 'error':
-                    self._optimization_complete()
-                    return
-                    
+                    log_lines.append(data)
+                elif msg_type in ('done', 'error'):
+                    finished = True
+                    break
         except queue.Empty:
-            pass
+            backlog = False
+        
+        if log_lines:
+            self._log("\n".join(log_lines))
+        if progress is not None:
+            self._show_progress(*progress)
+        if finished:
+            self._optimization_complete()
+            return
         
         if self.is_running:
-            self.root.after(100, self._poll_results)
+            self.root.after(1 if backlog else 100, self._poll_results)
+    
+    def _show_progress(self, progress: float, tested: int, total: int):
+        """Update the progress bar and the status line's rate and ETA."""
+        self.progress_var.set(progress)
+        # Calculate ETA
+        elapsed = time.time() - self.optimization_start_time
+        if tested > 0:
+            builds_per_sec = tested / elapsed
+            remaining = total - tested
+            eta_seconds = remaining / builds_per_sec if builds_per_sec > 0 else 0
+            if eta_seconds < 60:
+                eta_str = f"{eta_seconds:.0f}s"
+            elif eta_seconds < 3600:
+                eta_str = f"{eta_seconds/60:.1f}m"
+            else:
+                eta_str = f"{eta_seconds/3600:.1f}h"
+            self.status_label.configure(
+                text=f"Testing build {tested:,}/{total:,} | {builds_per_sec:.1f} builds/sec | ETA: {eta_str}"
+            )
+        else:
+            self.status_label.configure(text=f"Testing build {tested}/{total}...")
     
     def _optimization_complete(self):
         """Handle optimization completion."""
@@ -2450,7 +3185,7 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         self.start_btn.configure(state=tk.NORMAL)
         self.stop_btn.configure(state=tk.DISABLED)
         self.progress_var.set(100)
-        self.status_label.configure(text=f"Complete! Found {len(self.results)} valid builds.")
+        self.status_label.configure(text=f"Complete! Found {self.valid_build_count} valid builds.")
         
         # Update results display
         self._display_results()
@@ -2468,12 +3203,12 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
                 text_widget.configure(state=tk.DISABLED)
             return
         
-        # Sort by different criteria
-        by_stage = sorted(self.results, key=lambda r: r.avg_final_stage, reverse=True)[:10]
-        by_loot = sorted(self.results, key=lambda r: r.avg_loot_per_hour, reverse=True)[:10]
-        by_speed = sorted(self.results, key=lambda r: r.avg_elapsed_time)[:10]
-        by_damage = sorted(self.results, key=lambda r: r.avg_damage, reverse=True)[:10]
-        by_survival = sorted(self.results, key=lambda r: r.survival_rate, reverse=True)[:10]
+        # Top 10 by different criteria, without sorting every result for each column
+        by_stage = heapq.nlargest(10, self.results, key=attrgetter('avg_final_stage'))
+        by_loot = heapq.nlargest(10, self.results, key=attrgetter('avg_loot_per_hour'))
+        by_speed = heapq.nsmallest(10, self.results, key=attrgetter('avg_elapsed_time'))
+        by_damage = heapq.nlargest(10, self.results, key=attrgetter('avg_damage'))
+        by_survival = heapq.nlargest(10, self.results, key=attrgetter('survival_rate'))
         
         # Display each category
         self._display_category(self.result_tabs["stage"], by_stage, "Avg Stage", 
@@ -2574,7 +3309,7 @@ This tells you upgrading Power will help you progress 1.24 more stages on averag
         from tkinter import filedialog
         import yaml
         
-        best = sorted(self.results, key=lambda r: r.avg_final_stage, reverse=True)[0]
+        best = max(self.results, key=attrgetter('avg_final_stage'))
         
         filename = filedialog.asksaveasfilename(
             defaultextension=".yaml",
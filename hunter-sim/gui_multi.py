@@ -2962,8 +2962,9 @@ class HunterTab:
         # Yield after build generation
         time.sleep(0.01)
         
-        # Process builds one at a time
-        batch_size = 1
+        # Rust: one simulate_batch call per 100 builds, as progressive evolution does.
+        # Python: one build at a time so progress and stop checks stay responsive.
+        batch_size = 100 if use_rust else 1
         
         for batch_idx, batch_start in enumerate(range(0, len(builds), batch_size)):
             if self.stop_event.is_set():
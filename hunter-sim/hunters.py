@@ -194,7 +194,8 @@ class Hunter:
         Returns:
             bool: Whether the configs contain identical keys.
         """
-        return (set(cfg.keys()) ^ set(self.load_dummy().keys())) | set().union(*cfg.values()) ^ set().union(*self.load_dummy().values())
+        dummy = self.load_dummy()
+        return (set(cfg.keys()) ^ set(dummy.keys())) | set().union(*cfg.values()) ^ set().union(*dummy.values())
 
     def validate_build(self) -> Tuple[int, int, set, int, int]:
         """Validate the attributes of a build to make sure no attribute maximum levels are exceeded.
@@ -244,7 +245,7 @@ class Hunter:
         """
         if random.random() < self.evade_chance:
             self.total_evades += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE')
+            self._log_event('EVADE')
             return 0
         else:
             mitigated_damage = damage * (1 - self.damage_reduction)
@@ -252,7 +253,7 @@ class Hunter:
             self.total_taken += mitigated_damage
             self.total_mitigated += (damage - mitigated_damage)
             self.total_attacks_suffered += 1
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            self._log_event('TAKE\t%6.2f, %.2f HP left', mitigated_damage, self.hp)
             if self.is_dead():
                 self.on_death()
             return mitigated_damage
@@ -267,7 +268,7 @@ class Hunter:
         effective_heal = min(value, self.missing_hp)
         overhealing = value - effective_heal
         self.hp += effective_heal
-        logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t{source.upper().replace("_", " ")}\t{effective_heal:>6.2f} (+{overhealing:>6.2f} OVERHEAL)')
+        self._log_event('%s\t%6.2f (+%6.2f OVERHEAL)', source.upper().replace("_", " "), effective_heal, overhealing)
         match source.lower():
             case 'regen':
                 self.total_regen += effective_heal
@@ -588,12 +589,22 @@ class Hunter:
             self.hp = self.max_hp * 0.8
             self.revive_log.append(self.current_stage)
             self.times_revived += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tREVIVED, {self.talents["death_is_my_companion"] - self.times_revived} left')
+            self._log_event('REVIVED, %s left', self.talents["death_is_my_companion"] - self.times_revived)
         else:
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED\n')
+            self._log_event('DIED\n')
 
 
     ### UTILITY
+    def _log_event(self, msg: str, *args) -> None:
+        """Log a combat event, prefixed with the hunter's name and the sim time.
+
+        Args:
+            msg (str): %-style message, only formatted when debug logging is enabled.
+            *args: Arguments for `msg`.
+        """
+        if self.sim.debug:
+            logging.debug('[%*s][@%5s]:\t' + msg, hunter_name_spacing, self.name, self.sim.elapsed_time, *args)
+
     @property
     def missing_hp(self) -> float:
         return self.max_hp - self.hp
@@ -1097,15 +1108,15 @@ class Borge(Hunter):
             damage = self.power * self.special_damage
             self.total_crits += 1
             self.total_extra_from_crits += (damage - self.power)
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
+            self._log_event('ATTACK\t%6.2f (crit)', damage)
         else:
             damage = self.power
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
+            self._log_event('ATTACK\t%6.2f', damage)
         if self.mods["trample"] and not target.is_boss() and damage > target.max_hp:
             # Mod: Trample
             trample_kills = self.apply_trample(damage, current_target=target)
             if trample_kills > 1:
-                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTRAMPLE {trample_kills} enemies")
+                self._log_event('TRAMPLE %s enemies', trample_kills)
                 self.trample_kills += trample_kills
             else:
                 super(Borge, self).attack(target, damage)
@@ -1209,7 +1220,7 @@ class Borge(Hunter):
         """Apply the temporaryFires of War effect to Borge.
         """
         self.fires_of_war = self.talents["fires_of_war"] * 0.1
-        logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t[FoW]\t{self.fires_of_war:>6.2f} sec')
+        self._log_event('[FoW]\t%6.2f sec', self.fires_of_war)
 
     def apply_trample(self, damage: float, current_target) -> int:
         """Apply the Trample effect to a number of enemies.
@@ -1783,7 +1794,7 @@ class Ozzy(Hunter):
                 # Talent: Trickster's Boon
                 self.trickster_charges += 1
                 self.total_effect_procs += 1
-                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTRICKSTER")
+                self._log_event('TRICKSTER')
             if random.random() < self.special_chance:
                 # Stat: Multi-Strike
                 self.attack_queue.append('(MS)')
@@ -1833,7 +1844,7 @@ class Ozzy(Hunter):
         omen_damage = (damage + cripple_damage) * (omen_multiplier - 1)  # Track bonus from omen
         final_damage = (damage + cripple_damage) * omen_multiplier
         
-        logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{final_damage:>6.2f} {atk_type} CRIP: {cripple_damage:>6.2f} OMEN: x{omen_multiplier:.2f}")
+        self._log_event('ATTACK\t%6.2f %s CRIP: %6.2f OMEN: x%.2f', final_damage, atk_type, cripple_damage, omen_multiplier)
         super(Ozzy, self).attack(target, final_damage)
         self.total_decay_damage += omen_damage
         self.total_cripple_extra_damage += cripple_damage
@@ -1850,7 +1861,7 @@ class Ozzy(Hunter):
         if random.random() < self.effect_chance and (cs := self.talents["crippling_shots"]):
             # Talent: Crippling Shots, can proc on any attack
             self.crippling_on_target += cs
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tCRIPPLE\t+{cs}")
+            self._log_event('CRIPPLE\t+%s', cs)
             self.total_effect_procs += 1
         # Note: on_kill() is called by Enemy.on_death() - no duplicate call needed here
 
@@ -1875,14 +1886,14 @@ class Ozzy(Hunter):
         if self.trickster_charges and not boss_max_enrage:
             self.trickster_charges -= 1
             self.total_trickster_evades += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE (TRICKSTER)')
+            self._log_event('EVADE (TRICKSTER)')
             # Evaded via trickster - no damage, no Dance of Dashes proc
             return
         
         # WASM Step 2: Check normal evade (disabled at max enrage)
         if not boss_max_enrage and random.random() < self.evade_chance:
             self.total_evades += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE')
+            self._log_event('EVADE')
             # Evaded normally - no damage, no Dance of Dashes proc
             return
         
@@ -1896,16 +1907,16 @@ class Ozzy(Hunter):
         self.total_attacks_suffered += 1
         
         if boss_max_enrage:
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f} (MAX ENRAGE - no evade), {self.hp:.2f} HP left")
+            self._log_event('TAKE\t%6.2f (MAX ENRAGE - no evade), %.2f HP left', mitigated_damage, self.hp)
         else:
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            self._log_event('TAKE\t%6.2f, %.2f HP left', mitigated_damage, self.hp)
         
         # WASM Step 4: Dance of Dashes - ONLY when you take a crit (inside failed evade branch)
         if is_crit:
             if (dod := self.attributes["dance_of_dashes"]) and random.random() < dod * 0.15:
                 self.trickster_charges += 1
                 self.total_effect_procs += 1
-                logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDANCE OF DASHES - gained trickster charge')
+                self._log_event('DANCE OF DASHES - gained trickster charge')
         
         if self.is_dead():
             self.on_death()
@@ -1920,9 +1931,9 @@ class Ozzy(Hunter):
             self.hp = self.max_hp * 0.8
             self.revive_log.append(self.current_stage)
             self.times_revived += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tREVIVED, {total_revives - self.times_revived} left')
+            self._log_event('REVIVED, %s left', total_revives - self.times_revived)
         else:
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED\n')
+            self._log_event('DIED\n')
 
     def regen_hp(self) -> None:
         """Regenerates hp according to the regen stat, modified by Vectid Elixir + Soul of Snek.
@@ -2453,7 +2464,7 @@ class Knox(Hunter):
             damage_per_projectile = total_damage / num_projectiles
             self.total_ghost_bullet_damage += damage_per_projectile * extra_projectile_count
             
-        logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tSALVO\t{total_damage:>6.2f} ({num_projectiles} projectiles)")
+        self._log_event('SALVO\t%6.2f (%s projectiles)', total_damage, num_projectiles)
         super(Knox, self).attack(target, total_damage)
         self.total_damage += total_damage
         self.total_attacks += 1
@@ -2474,7 +2485,7 @@ class Knox(Hunter):
             blocked_amount = damage * 0.5  # Block reduces damage by 50%
             self.total_blocked += blocked_amount
             damage = damage - blocked_amount
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tBLOCK\t{blocked_amount:>6.2f}')
+            self._log_event('BLOCK\t%6.2f', blocked_amount)
         
         # Apply remaining damage through parent class
         if damage > 0:
@@ -2483,7 +2494,7 @@ class Knox(Hunter):
             self.total_taken += mitigated_damage
             self.total_mitigated += (damage - mitigated_damage)
             self.total_attacks_suffered += 1
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            self._log_event('TAKE\t%6.2f, %.2f HP left', mitigated_damage, self.hp)
             if self.is_dead():
                 self.on_death()
 
@@ -355,6 +355,7 @@ class Simulation():
         self.current_stage = -1
         self.queue: List[tuple] = []
         self.elapsed_time: int = 0
+        self.debug: bool = False  # Units only format their per-event debug messages when set
 
     def complete_stage(self) -> None:
         """Increment stage counter for simulation and hunter.
@@ -400,21 +401,26 @@ class Simulation():
         self.current_stage = 0
         self.elapsed_time = 0
         self.queue = []
+        # debug messages format the whole queue and every unit event, so only build them when they will be emitted
+        self.debug = debug = logging.getLogger().isEnabledFor(logging.DEBUG)
         hpush(self.queue, (round(hunter.speed, 3), 1, 'hunter'))
         hpush(self.queue, (self.elapsed_time, 3, 'regen'))
         while not hunter.is_dead():
-            logging.debug('')
-            logging.debug(f'Entering STAGE {self.current_stage}')
+            if debug:
+                logging.debug('')
+                logging.debug(f'Entering STAGE {self.current_stage}')
             self.spawn_enemies(hunter)
             while self.enemies:
-                logging.debug('')
-                logging.debug(hunter)
                 enemy = self.enemies.pop(0)
-                logging.debug(enemy)
+                if debug:
+                    logging.debug('')
+                    logging.debug(hunter)
+                    logging.debug(enemy)
                 enemy.queue_initial_attack()
                 # combat loop
                 while not enemy.is_dead() and not hunter.is_dead():
-                    logging.debug(f'[  QUEUE]:           {self.queue}')
+                    if debug:
+                        logging.debug(f'[  QUEUE]:           {self.queue}')
                     prev_time, _, action = hpop(self.queue)
                     match action:
                         case 'hunter':
@@ -251,11 +251,11 @@ class Enemy:
         if random.random() < self.special_chance:
             damage = self.power * self.special_damage
             is_crit = True
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
+            self._log_event('ATTACK\t%6.2f (crit)', damage)
         else:
             damage = self.power
             is_crit = False
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
+            self._log_event('ATTACK\t%6.2f', damage)
         hunter.receive_damage(self, damage, is_crit)
 
     def receive_damage(self, damage: float, is_reflected: bool = False) -> None:
@@ -265,11 +265,11 @@ class Enemy:
             damage (float): Damage to receive.
         """
         if not is_reflected and random.random() < self.evade_chance:
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE")
+            self._log_event('EVADE')
         else:
             mitigated_damage = damage * (1 - self.damage_reduction)
             self.hp -= mitigated_damage
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            self._log_event('TAKE\t%6.2f, %.2f HP left', mitigated_damage, self.hp)
             if self.is_dead():
                 if is_reflected:
                     self.sim.hunter.helltouch_kills += 1
@@ -284,7 +284,7 @@ class Enemy:
         """
         effective_heal = min(value, self.missing_hp)
         self.hp += effective_heal
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t{source.upper().replace('_', ' ')}\t{effective_heal:>6.2f}")
+        self._log_event('%s\t%6.2f', source.upper().replace('_', ' '), effective_heal)
 
     def regen_hp(self) -> None:
         """Regenerates hp according to the regen stat.
@@ -326,7 +326,7 @@ class Enemy:
         qe = [(p1, p2, u) for p1, p2, u in self.sim.queue if u == 'enemy'][0]
         self.sim.queue.remove(qe)
         hpush(self.sim.queue, (qe[0] + duration, qe[1], qe[2]))
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tSTUNNED\t{duration:>6.2f} sec")
+        self._log_event('STUNNED\t%6.2f sec', duration)
 
     def is_boss(self) -> bool:
         """Check if the unit is a boss.
@@ -348,7 +348,7 @@ class Enemy:
         """Executes on death effects. For enemy units, that is mostly just removing them from the sim queue and incrementing hunter kills.
         """
         if not suppress_logging:
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED")
+            self._log_event('DIED')
         self.sim.queue = [(p1, p2, u) for p1, p2, u in self.sim.queue if u not in ['enemy', 'enemy_special']]
         heapify(self.sim.queue)
         self.sim.hunter.total_kills += 1
@@ -363,6 +363,15 @@ class Enemy:
         self.on_death(suppress_logging=True)
 
     ### UTILITY
+    def _log_event(self, msg: str, *args) -> None:
+        """Log a combat event, prefixed with the unit's name and the sim time.
+
+        Args:
+            msg (str): %-style message, only formatted when debug logging is enabled.
+            *args: Arguments for `msg`.
+        """
+        if self.sim.debug:
+            logging.debug('[%*s][@%5s]:\t' + msg, unit_name_spacing, self.name, self.sim.elapsed_time, *args)
 
     @property
     def missing_hp(self) -> float:
@@ -503,13 +512,13 @@ class Boss(Enemy):
         """
         super(Boss, self).attack(hunter)
         self.enrage_stacks += 1
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tENRAGE\t{self.enrage_stacks:>6.2f} stacks")
+        self._log_event('ENRAGE\t%6.2f stacks', self.enrage_stacks)
         # WASM: Max enrage triggers when stacks > 200 (not >= 200)
         if self.enrage_stacks > 200 and not self.max_enrage:
             self.max_enrage = True
             self.power = self.base_power * 3  # CIFI: 3x base power at max enrage
             self.special_chance = 1  # CIFI: 100% crit at max enrage
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tMAX ENRAGE (x3 base damage, 100% crit chance)")
+            self._log_event('MAX ENRAGE (x3 base damage, 100%% crit chance)')
 
     def attack_special(self, hunter: Hunter) -> None:
         """Attack the hunter with a special attack.
@@ -521,11 +530,11 @@ class Boss(Enemy):
             if random.random() < self.special_chance:
                 damage = self.power * self.special_damage
                 is_crit = True
-                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY (crit)")
+                self._log_event('ATTACK\t%6.2f SECONDARY (crit)', damage)
             else:
                 damage = self.power
                 is_crit = False
-                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY")
+                self._log_event('ATTACK\t%6.2f SECONDARY', damage)
             hunter.receive_damage(self, damage, is_crit)
             self.enrage_stacks += 1
         elif self.secondary_attack == 'exoscarab':
@@ -565,7 +574,7 @@ class Boss(Enemy):
             # WASM: +5 enrage stacks added when harden ends
             self.enrage_stacks += 5
             self.damage_reduction = self.previous_dr
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tHARDEN ended, +5 enrage (now {self.enrage_stacks})")
+            self._log_event('HARDEN ended, +5 enrage (now %s)', self.enrage_stacks)
 
     def on_death(self) -> None:
         """Extends the Enemy::on_death() method to log enrage stacks on death.